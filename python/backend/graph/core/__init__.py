@@ -1,43 +1,56 @@
 """
 GraphRAG Core Components
 Graph building, entity extraction, relationship discovery, and semantic querying
+
+Re-exports are resolved lazily (PEP 562) so entrypoints that only need the
+catalog/build pipeline never pay the import cost of the query-engine stack
+(numpy, embedding models, etc.).
 """
 
-# Phase 5.2: Graph Building Components
-from .entity_extractor import AgenticEntityExtractor, AgenticNode
-from .relationship_builder import AgenticRelationshipBuilder, AgenticEdge
-from .graph_builder import AgenticGraphBuilder
-from .catalog_builder import CatalogBuilder
-
-# Phase 5.3: Query Engine Components
-from .semantic_search import SemanticSearchEngine, SearchResult, SearchType
-from .graph_traversal import GraphTraversalEngine, Path, TraversalType
-from .explanation_generator import ExplanationGenerator, Explanation, ExplanationType
-from .response_formatter import ResponseFormatter, ResponseFormat, QueryResponse
-from .query_engine import QueryEngine, QueryType, QueryRequest
-
-__all__ = [
-    # Phase 5.2
-    'AgenticEntityExtractor',
-    'AgenticNode',
-    'AgenticRelationshipBuilder',
-    'AgenticEdge',
-    'AgenticGraphBuilder',
-    'CatalogBuilder',
-    # Phase 5.3
-    'SemanticSearchEngine',
-    'SearchResult',
-    'SearchType',
-    'GraphTraversalEngine',
-    'Path',
-    'TraversalType',
-    'ExplanationGenerator',
-    'Explanation',
-    'ExplanationType',
-    'ResponseFormatter',
-    'ResponseFormat',
-    'QueryResponse',
-    'QueryEngine',
-    'QueryType',
-    'QueryRequest',
-]
+import importlib
+
+# Attribute name -> defining submodule
+_LAZY = {
+    # Phase 5.2: Graph Building Components
+    'AgenticEntityExtractor': '.entity_extractor',
+    'AgenticNode': '.entity_extractor',
+    'AgenticNodeTable': '.entity_extractor',
+    'AgenticRelationshipBuilder': '.relationship_builder',
+    'AgenticEdge': '.relationship_builder',
+    'AgenticGraphBuilder': '.graph_builder',
+    'CatalogBuilder': '.catalog_builder',
+    # Phase 5.3: Query Engine Components
+    'SemanticSearchEngine': '.semantic_search',
+    'SearchResult': '.semantic_search',
+    'SearchType': '.semantic_search',
+    'GraphTraversalEngine': '.graph_traversal',
+    'Path': '.graph_traversal',
+    'TraversalType': '.graph_traversal',
+    'ExplanationGenerator': '.explanation_generator',
+    'Explanation': '.explanation_generator',
+    'ExplanationType': '.explanation_generator',
+    'ResponseFormatter': '.response_formatter',
+    'ResponseFormat': '.response_formatter',
+    'QueryResponse': '.response_formatter',
+    'QueryEngine': '.query_engine',
+    'QueryType': '.query_engine',
+    'QueryRequest': '.query_engine',
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    module = importlib.import_module(module_name, __name__)
+    value = getattr(module, name)
+    globals()[name] = value  # Cache so subsequent access skips this hook
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
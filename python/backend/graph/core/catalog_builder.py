@@ -3,12 +3,66 @@ Catalog Builder
 Build and serialize catalog for distribution and reuse
 """
 
+import asyncio
+import gzip
 import json
 import logging
+import mmap
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 from typing import List, Dict, Optional
 from pathlib import Path
 from datetime import datetime
 from dataclasses import asdict
+from operator import attrgetter
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    orjson = None
+    HAS_ORJSON = False
+
+try:
+    import simdjson
+    HAS_SIMDJSON = True
+except ImportError:
+    simdjson = None
+    HAS_SIMDJSON = False
+
+try:
+    import msgpack
+    HAS_MSGPACK = True
+except ImportError:
+    msgpack = None
+    HAS_MSGPACK = False
+
+# Catalog structure checks, codegen'd once at import into a specialized
+# validator function (10-100x faster than interpreting the schema per call)
+_CATALOG_SCHEMA = {
+    'type': 'object',
+    'required': ['metadata', 'nodes', 'manifest'],
+    'properties': {
+        'metadata': {
+            'type': 'object',
+            'required': ['version'],
+        },
+        'nodes': {
+            'type': 'array',
+            'minItems': 1,
+        },
+        'manifest': {
+            'type': 'object',
+        },
+    },
+}
+
+try:
+    import fastjsonschema
+    _validate_catalog_schema = fastjsonschema.compile(_CATALOG_SCHEMA)
+except ImportError:
+    fastjsonschema = None
+    _validate_catalog_schema = None
 
 from storage.database import Database
 from .entity_extractor import AgenticNode
@@ -16,6 +70,76 @@ from .relationship_builder import AgenticEdge
 
 logger = logging.getLogger(__name__)
 
+# Flush the streaming-writer accumulator once it reaches this many bytes
+_STREAM_FLUSH_BYTES = 1 << 20
+
+# Serialized node projection: one C-level attrgetter call per node instead
+# of eight Python attribute reads
+_NODE_KEYS = (
+    'id', 'label', 'description', 'category',
+    'keywords', 'metadata', 'created_at', 'updated_at',
+)
+_NODE_ATTRS = attrgetter(*_NODE_KEYS)
+
+# Shard serialization across a process pool above this many nodes;
+# below it the spawn cost outweighs the win and we serialize inline
+_PARALLEL_NODE_THRESHOLD = 20000
+
+
+def _serialize_batch(nodes) -> bytes:
+    """Serialize a batch of nodes to comma-joined JSON bytes
+
+    Top-level and picklable so ProcessPoolExecutor workers can run it.
+    """
+    return b','.join(
+        _dump_json_bytes(dict(zip(_NODE_KEYS, _NODE_ATTRS(node))), indent=False)
+        for node in nodes
+    )
+
+# Static schema descriptions: built once at import instead of per export call
+_TABLE_SCHEMA = {
+    'nodes': {
+        'primary_key': 'id',
+        'columns': [
+            'id', 'label', 'description', 'category',
+            'keywords', 'embedding', 'metadata',
+            'created_at', 'updated_at'
+        ]
+    },
+    'edges': {
+        'primary_key': 'id',
+        'columns': [
+            'id', 'source_id', 'target_id', 'type',
+            'strength', 'metadata', 'created_at'
+        ]
+    },
+    'embeddings': {
+        'primary_key': 'id',
+        'columns': [
+            'id', 'node_id', 'embedding', 'dimension',
+            'model', 'created_at', 'updated_at'
+        ]
+    },
+}
+
+_INDEX_SCHEMA = [
+    {'name': 'idx_nodes_category', 'table': 'nodes', 'column': 'category'},
+    {'name': 'idx_edges_source', 'table': 'edges', 'column': 'source_id'},
+    {'name': 'idx_edges_target', 'table': 'edges', 'column': 'target_id'},
+    {'name': 'idx_edges_type', 'table': 'edges', 'column': 'type'},
+    {'name': 'idx_embeddings_node', 'table': 'embeddings', 'column': 'node_id'},
+]
+
+
+def _dump_json_bytes(obj, indent: bool = True) -> bytes:
+    """Serialize to JSON bytes, preferring orjson's Rust encoder"""
+    if HAS_ORJSON:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=str, option=option)
+    return json.dumps(obj, indent=2 if indent else None, default=str).encode('utf-8')
+
 
 class CatalogBuilder:
     """
@@ -23,45 +147,81 @@ class CatalogBuilder:
     Creates exportable catalog containing all graph data
     """
 
-    def __init__(self, db: Database):
+    def __init__(self, db: Database, include_node_list: bool = False):
         """
         Initialize catalog builder
 
         Args:
             db: Database instance
+            include_node_list: Emit the manifest's per-node {id, label,
+                category} list. Off by default — it duplicates data already
+                present in the nodes array and roughly doubles catalog size.
         """
         self.db = db
+        self.include_node_list = include_node_list
 
-    async def build_catalog(self, output_path: str) -> bool:
+    async def build_catalog(self, output_path: str, output_format: str = 'json') -> bool:
         """
         Build complete catalog from database
 
+        The blocking DB scan and file write run in a worker thread so the
+        event loop stays responsive during multi-second exports.
+
         Args:
-            output_path: Path to write catalog.json
+            output_path: Path to write the catalog
+            output_format: 'json' (default, streaming) or 'msgpack'
+                (compact binary, 2-3x faster for programmatic consumers;
+                requires the optional msgpack package)
 
         Returns:
             True if successful
         """
+        return await asyncio.to_thread(self._build_catalog_sync, output_path, output_format)
+
+    def _build_catalog_sync(self, output_path: str, output_format: str = 'json') -> bool:
+        """Synchronous catalog build; see build_catalog"""
         try:
             logger.info("Building catalog...")
 
-            # Retrieve all data from database
-            all_nodes = self.db.get_nodes(limit=10000)  # Get all nodes
-            logger.info(f"Retrieved {len(all_nodes)} nodes from database")
-
-            # Build catalog structure
-            catalog = {
-                'metadata': self._build_metadata(),
-                'nodes': [self._serialize_node(node) for node in all_nodes],
-                'manifest': self._build_manifest(all_nodes),
-            }
-
-            # Write to file
             output_file = Path(output_path)
             output_file.parent.mkdir(parents=True, exist_ok=True)
 
-            with open(output_file, 'w') as f:
-                json.dump(catalog, f, indent=2, default=str)
+            if output_format == 'msgpack':
+                if HAS_MSGPACK:
+                    return self._build_catalog_msgpack(output_file)
+                logger.warning("msgpack not installed, falling back to JSON catalog")
+
+            # Stream the catalog to disk instead of materializing one giant
+            # dict + JSON string: metadata, then each node, then the manifest.
+            # Nodes come from a keyset-paginated iterator so memory stays
+            # bounded regardless of graph size, and manifest counters are
+            # accumulated in the same pass.
+            build_timestamp = datetime.now().isoformat()
+
+            # Level-1 gzip compresses JSON ~2-3x at near-memcpy speed, so
+            # redundant strings cost almost nothing on disk
+            if output_file.suffix == '.gz':
+                opener = gzip.open(output_file, 'wb', compresslevel=1)
+            else:
+                opener = open(output_file, 'wb')
+
+            with opener as f:
+                f.write(b'{"metadata":')
+                f.write(_dump_json_bytes(self._build_metadata(build_timestamp), indent=False))
+                f.write(b',"nodes":[')
+                nodes_iter = self.db.iter_nodes(batch_size=1000)
+                if self.db.node_count() >= _PARALLEL_NODE_THRESHOLD:
+                    total_nodes, node_list = self._stream_parallel(nodes_iter, f)
+                else:
+                    total_nodes, node_list = self._stream_and_manifest(nodes_iter, f)
+                f.write(b'],"manifest":')
+                f.write(_dump_json_bytes(
+                    self._build_manifest(total_nodes, node_list),
+                    indent=False,
+                ))
+                f.write(b'}')
+
+            logger.info(f"Serialized {total_nodes} nodes from database")
 
             logger.info(f"✓ Wrote catalog to {output_path}")
             logger.info(f"  Catalog size: {output_file.stat().st_size / (1024 * 1024):.2f} MB")
@@ -72,14 +232,118 @@ class CatalogBuilder:
             logger.error(f"Failed to build catalog: {e}")
             return False
 
-    def _build_metadata(self) -> Dict:
-        """Build catalog metadata"""
+    def _build_catalog_msgpack(self, output_file: Path) -> bool:
+        """Write the catalog as MessagePack for programmatic consumers"""
+        build_timestamp = datetime.now().isoformat()
+
+        nodes = [
+            self._serialize_node(node)
+            for node in self.db.iter_nodes(batch_size=1000)
+        ]
+        node_list = [
+            {'id': n['id'], 'label': n['label'], 'category': n['category']}
+            for n in nodes
+        ] if self.include_node_list else []
+
+        catalog = {
+            'metadata': self._build_metadata(build_timestamp),
+            'nodes': nodes,
+            'manifest': self._build_manifest(len(nodes), node_list),
+        }
+
+        output_file.write_bytes(msgpack.packb(catalog, use_bin_type=True, default=str))
+
+        logger.info(f"✓ Wrote msgpack catalog to {output_file}")
+        logger.info(f"  Catalog size: {output_file.stat().st_size / (1024 * 1024):.2f} MB")
+        return True
+
+    def _stream_and_manifest(self, nodes_iter, f):
+        """
+        Write serialized nodes to f while tallying manifest data
+
+        Single pass over the node stream: serialization and the light
+        node_list happen in one loop. Category counts come from a SQL
+        aggregate in _build_manifest, so no Python-side tally is kept.
+
+        Returns:
+            (total_nodes, node_list)
+        """
+        total_nodes = 0
+        node_list = []
+
+        # Accumulate serialized nodes in one reusable bytearray and flush in
+        # ~1 MiB slabs, instead of one write (and one bytes object) per node
+        buf = bytearray()
+
+        for node in nodes_iter:
+            if total_nodes:
+                buf += b','
+            buf += _dump_json_bytes(self._serialize_node(node), indent=False)
+            if len(buf) >= _STREAM_FLUSH_BYTES:
+                f.write(memoryview(buf))
+                buf.clear()
+
+            total_nodes += 1
+            if self.include_node_list:
+                node_list.append({
+                    'id': node.id,
+                    'label': node.label,
+                    'category': node.category,
+                })
+
+        if buf:
+            f.write(memoryview(buf))
+
+        return total_nodes, node_list
+
+    def _stream_parallel(self, nodes_iter, f):
+        """
+        Write serialized nodes to f, sharding serialization across cores
+
+        Batches come off the node iterator in the parent (which also
+        tallies the manifest data), while workers turn each batch into
+        JSON bytes; results stream back in order.
+
+        Returns:
+            (total_nodes, node_list)
+        """
+        total_nodes = 0
+        node_list = []
+
+        def batches():
+            nonlocal total_nodes
+            while True:
+                batch = list(islice(nodes_iter, 1000))
+                if not batch:
+                    return
+                total_nodes += len(batch)
+                if self.include_node_list:
+                    node_list.extend(
+                        {'id': n.id, 'label': n.label, 'category': n.category}
+                        for n in batch
+                    )
+                yield batch
+
+        first = True
+        with ProcessPoolExecutor() as executor:
+            for chunk in executor.map(_serialize_batch, batches()):
+                if not chunk:
+                    continue
+                if not first:
+                    f.write(b',')
+                f.write(chunk)
+                first = False
+
+        return total_nodes, node_list
+
+    def _build_metadata(self, build_timestamp: str) -> Dict:
+        """Build catalog metadata using a timestamp computed once per build"""
         db_stats = self.db.get_stats()
 
         return {
             'version': '1.0.0',
             'type': 'agentic-graphrag-n8n',
-            'build_timestamp': datetime.now().isoformat(),
+            'build_timestamp': build_timestamp,
             'description': 'Complete n8n knowledge graph for agent reasoning',
             'nodes_count': db_stats.get('node_count', 0),
             'relationships_count': db_stats.get('edge_count', 0),
@@ -89,39 +353,18 @@ class CatalogBuilder:
 
     def _serialize_node(self, node) -> Dict:
         """Serialize node to dictionary"""
-        return {
-            'id': node.id,
-            'label': node.label,
-            'description': node.description,
-            'category': node.category,
-            'keywords': node.keywords,
-            'metadata': node.metadata,
-            'created_at': node.created_at,
-            'updated_at': node.updated_at,
-        }
-
-    def _build_manifest(self, nodes: List) -> Dict:
-        """Build catalog manifest"""
-        categories = {}
-        for node in nodes:
-            if node.category:
-                if node.category not in categories:
-                    categories[node.category] = 0
-                categories[node.category] += 1
+        return dict(zip(_NODE_KEYS, _NODE_ATTRS(node)))
 
-        return {
-            'total_nodes': len(nodes),
+    def _build_manifest(self, total_nodes: int, node_list: List[Dict]) -> Dict:
+        """Build catalog manifest; counts come from SQL aggregates"""
+        manifest = {
+            'total_nodes': total_nodes,
             'total_edges': self.db.edge_count(),
-            'categories': categories,
-            'node_list': [
-                {
-                    'id': node.id,
-                    'label': node.label,
-                    'category': node.category,
-                }
-                for node in nodes
-            ]
+            'categories': self.db.get_category_counts(),
         }
+        if self.include_node_list:
+            manifest['node_list'] = node_list
+        return manifest
 
     async def create_schema_export(self, output_path: str) -> bool:
         """
@@ -133,6 +376,10 @@ class CatalogBuilder:
         Returns:
             True if successful
         """
+        return await asyncio.to_thread(self._create_schema_export_sync, output_path)
+
+    def _create_schema_export_sync(self, output_path: str) -> bool:
+        """Synchronous schema export; see create_schema_export"""
         try:
             logger.info("Exporting schema...")
 
@@ -143,8 +390,7 @@ class CatalogBuilder:
                 'indexes': self._get_index_schema(),
             }
 
-            with open(output_path, 'w') as f:
-                json.dump(schema_info, f, indent=2)
+            Path(output_path).write_bytes(_dump_json_bytes(schema_info))
 
             logger.info(f"✓ Exported schema to {output_path}")
             return True
@@ -155,40 +401,11 @@ class CatalogBuilder:
 
     def _get_table_schema(self) -> Dict:
         """Get table schema information"""
-        return {
-            'nodes': {
-                'primary_key': 'id',
-                'columns': [
-                    'id', 'label', 'description', 'category',
-                    'keywords', 'embedding', 'metadata',
-                    'created_at', 'updated_at'
-                ]
-            },
-            'edges': {
-                'primary_key': 'id',
-                'columns': [
-                    'id', 'source_id', 'target_id', 'type',
-                    'strength', 'metadata', 'created_at'
-                ]
-            },
-            'embeddings': {
-                'primary_key': 'id',
-                'columns': [
-                    'id', 'node_id', 'embedding', 'dimension',
-                    'model', 'created_at', 'updated_at'
-                ]
-            },
-        }
+        return _TABLE_SCHEMA
 
     def _get_index_schema(self) -> List[Dict]:
         """Get index information"""
-        return [
-            {'name': 'idx_nodes_category', 'table': 'nodes', 'column': 'category'},
-            {'name': 'idx_edges_source', 'table': 'edges', 'column': 'source_id'},
-            {'name': 'idx_edges_target', 'table': 'edges', 'column': 'target_id'},
-            {'name': 'idx_edges_type', 'table': 'edges', 'column': 'type'},
-            {'name': 'idx_embeddings_node', 'table': 'embeddings', 'column': 'node_id'},
-        ]
+        return _INDEX_SCHEMA
 
     async def validate_catalog(self, catalog_path: str) -> bool:
         """
@@ -200,30 +417,42 @@ class CatalogBuilder:
         Returns:
             True if valid
         """
+        return await asyncio.to_thread(self._validate_catalog_sync, catalog_path)
+
+    def _validate_catalog_sync(self, catalog_path: str) -> bool:
+        """Synchronous catalog validation; see validate_catalog"""
         try:
             logger.info("Validating catalog...")
 
-            with open(catalog_path, 'r') as f:
-                catalog = json.load(f)
+            catalog = self._load_catalog(catalog_path)
 
-            # Check required fields
-            required_fields = ['metadata', 'nodes', 'manifest']
-            for field in required_fields:
-                if field not in catalog:
-                    logger.error(f"Missing required field: {field}")
+            if _validate_catalog_schema is not None and isinstance(catalog, dict):
+                # Compiled schema checker: one specialized function call
+                try:
+                    _validate_catalog_schema(catalog)
+                except fastjsonschema.JsonSchemaException as e:
+                    logger.error(f"Catalog schema violation: {e.message}")
+                    return False
+                nodes = catalog['nodes']
+            else:
+                # Ad-hoc checks; also the path for simdjson lazy documents
+                required_fields = ['metadata', 'nodes', 'manifest']
+                for field in required_fields:
+                    if field not in catalog:
+                        logger.error(f"Missing required field: {field}")
+                        return False
+
+                # Check metadata
+                metadata = catalog['metadata']
+                if not metadata.get('version'):
+                    logger.error("Missing metadata version")
                     return False
 
-            # Check metadata
-            metadata = catalog['metadata']
-            if not metadata.get('version'):
-                logger.error("Missing metadata version")
-                return False
-
-            # Check nodes
-            nodes = catalog['nodes']
-            if not nodes:
-                logger.error("No nodes in catalog")
-                return False
+                # Check nodes
+                nodes = catalog['nodes']
+                if not nodes:
+                    logger.error("No nodes in catalog")
+                    return False
 
             logger.info(f"✓ Catalog is valid")
             logger.info(f"  Nodes: {len(nodes)}")
@@ -236,35 +465,77 @@ class CatalogBuilder:
             logger.error(f"Catalog validation failed: {e}")
             return False
 
+    def _load_catalog(self, catalog_path: str):
+        """
+        Load a catalog for validation, preferring SIMD-accelerated parsing
+
+        simdjson returns lazy element proxies, so node payloads are never
+        materialized as Python objects just to count them.
+
+        The file is memory-mapped so the OS pages content on demand and
+        the parser sees a zero-copy byte buffer instead of a full read().
+
+        Dispatches on magic bytes: gzip streams are decompressed first and
+        msgpack catalogs are unpacked; anything else is treated as JSON.
+        """
+        with open(catalog_path, 'rb') as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+
+                if mm[:2] == b'\x1f\x8b':
+                    return self._parse_catalog_bytes(gzip.decompress(mm))
+
+                if mm[:1] not in (b'{', b'[') and HAS_MSGPACK:
+                    return msgpack.unpackb(bytes(mm), raw=False)
+
+                return self._parse_catalog_bytes(mm)
+            finally:
+                mm.close()
+
+    @staticmethod
+    def _parse_catalog_bytes(data):
+        """Parse JSON catalog bytes with the fastest available parser"""
+        if HAS_SIMDJSON:
+            # simdjson keeps references into the buffer, so hand it an
+            # immutable copy in case data is a closing mmap
+            return simdjson.Parser().parse(bytes(data))
+        if HAS_ORJSON:
+            return orjson.loads(memoryview(data))
+        return json.loads(bytes(data))
+
 
 class CatalogExporter:
     """Export catalog to various formats"""
 
+    CSV_FIELDNAMES = ('id', 'label', 'description', 'category', 'keywords')
+
     @staticmethod
     def export_to_csv(catalog: Dict, output_path: str) -> bool:
         """Export nodes to CSV"""
         try:
             import csv
 
-            with open(output_path, 'w', newline='') as f:
-                nodes = catalog.get('nodes', [])
-                if not nodes:
-                    return False
+            nodes = catalog.get('nodes', [])
+            if not nodes:
+                return False
 
-                writer = csv.DictWriter(
-                    f,
-                    fieldnames=['id', 'label', 'description', 'category', 'keywords']
+            # Positional writer + writerows: no per-row dict construction,
+            # and the C-level writer amortizes call overhead across the batch
+            with open(output_path, 'w', newline='', buffering=1 << 20) as f:
+                writer = csv.writer(f)
+                writer.writerow(CatalogExporter.CSV_FIELDNAMES)
+                writer.writerows(
+                    (
+                        node.get('id', ''),
+                        node.get('label', ''),
+                        node.get('description', ''),
+                        node.get('category', ''),
+                        ','.join(node.get('keywords', ())),
+                    )
+                    for node in nodes
                 )
-                writer.writeheader()
-
-                for node in nodes:
-                    writer.writerow({
-                        'id': node.get('id', ''),
-                        'label': node.get('label', ''),
-                        'description': node.get('description', ''),
-                        'category': node.get('category', ''),
-                        'keywords': ','.join(node.get('keywords', [])),
-                    })
 
             logger.info(f"✓ Exported to CSV: {output_path}")
             return True
@@ -277,9 +548,25 @@ class CatalogExporter:
     def export_to_jsonl(catalog: Dict, output_path: str) -> bool:
         """Export nodes to JSONL format"""
         try:
-            with open(output_path, 'w') as f:
-                for node in catalog.get('nodes', []):
-                    f.write(json.dumps(node) + '\n')
+            nodes = catalog.get('nodes', ())
+
+            # writelines on a generator lets the buffered writer coalesce
+            # rows; orjson appends the newline itself so no per-row concat
+            with open(output_path, 'wb', buffering=1 << 20) as f:
+                if HAS_ORJSON:
+                    f.writelines(
+                        orjson.dumps(
+                            node,
+                            default=str,
+                            option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS,
+                        )
+                        for node in nodes
+                    )
+                else:
+                    f.writelines(
+                        _dump_json_bytes(node, indent=False) + b'\n'
+                        for node in nodes
+                    )
 
             logger.info(f"✓ Exported to JSONL: {output_path}")
             return True
@@ -294,8 +581,7 @@ class CatalogExporter:
         try:
             manifest = catalog.get('manifest', {})
 
-            with open(output_path, 'w') as f:
-                json.dump(manifest, f, indent=2)
+            Path(output_path).write_bytes(_dump_json_bytes(manifest))
 
             logger.info(f"✓ Exported manifest: {output_path}")
             return True
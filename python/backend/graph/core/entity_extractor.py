@@ -3,23 +3,94 @@ Agentic Entity Extractor
 Extract n8n nodes with agent-friendly metadata
 """
 
+import heapq
+import os
 import sqlite3
+import sys
 import json
 import re
 import logging
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from typing import List, Dict, Optional, Set
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 from pathlib import Path
 import numpy as np
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    orjson = None
+    HAS_ORJSON = False
+
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    ahocorasick = None
+    HAS_AHOCORASICK = False
+
+
+def _json_loads(data):
+    """Parse JSON with orjson when available (2-10x faster than stdlib)"""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dump_bytes(obj) -> bytes:
+    """Serialize one object to JSON bytes with orjson when available"""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, default=str)
+    return json.dumps(obj, default=str).encode('utf-8')
+
 logger = logging.getLogger(__name__)
 
+# Keyword tokenization: translate separators to spaces in one C-level
+# pass, then split on whitespace runs — no regex engine per call.
+# O(1) stopword membership via frozenset.
+_SEP_TABLE = str.maketrans({c: ' ' for c in ',;:-()[].'})
+_STOPWORDS = frozenset({'the', 'and', 'with', 'from', 'that', 'this', 'for', 'your'})
+
+# Enrich across a process pool above this many rows; below it the worker
+# spawn cost outweighs the per-node CPU work
+_PARALLEL_ROW_THRESHOLD = 2000
+_ENRICH_CHUNK_ROWS = 256
+
+# One extractor per worker process, created on first chunk
+_worker_extractor = None
 
-@dataclass
+
+def _enrich_chunk(rows: List[tuple]) -> List[Dict]:
+    """Enrich a chunk of raw rows; runs inside pool workers
+
+    Returns plain dicts rather than AgenticNode instances to keep the
+    pickle payload cheap; the parent rebuilds dataclasses.
+    """
+    global _worker_extractor
+    if _worker_extractor is None:
+        _worker_extractor = AgenticEntityExtractor('')
+
+    complexities, curves = AgenticEntityExtractor._batch_complexity_curves(
+        [row[2] for row in rows]
+    )
+
+    out = []
+    for row, cx, curve in zip(rows, complexities, curves):
+        out.append(_worker_extractor._enrich_row(*row, cx, curve).to_dict())
+    return out
+
+
+@dataclass(slots=True)
 class AgenticNode:
     """
     Enhanced node model optimized for agent reasoning
     Includes agent use cases, failure modes, and tips
+
+    Slotted to drop the per-instance __dict__; with tens of thousands of
+    nodes held during a build this cuts memory substantially and speeds
+    attribute access.
     """
     # Basic identification
     id: str
@@ -64,8 +135,34 @@ class AgenticNode:
     metadata: Dict = field(default_factory=dict)
 
     def to_dict(self) -> Dict:
-        """Convert to dictionary for storage"""
-        return asdict(self)
+        """Convert to dictionary for storage
+
+        Explicit dict literal with shallow container copies: asdict's
+        field introspection and recursive deepcopy dominated serialization
+        time when run across thousands of nodes.
+        """
+        return {
+            'id': self.id,
+            'label': self.label,
+            'description': self.description,
+            'category': self.category,
+            'keywords': list(self.keywords),
+            'use_cases': list(self.use_cases),
+            'prerequisites': list(self.prerequisites),
+            'agent_tips': list(self.agent_tips),
+            'failure_modes': list(self.failure_modes),
+            'common_configurations': dict(self.common_configurations),
+            'properties': list(self.properties),
+            'operations': list(self.operations),
+            'success_rate': self.success_rate,
+            'usage_frequency': self.usage_frequency,
+            'average_rating': self.average_rating,
+            'complexity': self.complexity,
+            'learning_curve': self.learning_curve,
+            'node_type': self.node_type,
+            'version': self.version,
+            'metadata': dict(self.metadata),
+        }
 
     @classmethod
     def from_dict(cls, data: Dict) -> 'AgenticNode':
@@ -191,6 +288,61 @@ class AgenticEntityExtractor:
         ],
     }
 
+    # Prerequisite keyword groups, checked against the full node id
+    PREREQ_GROUPS = {
+        'auth': ('slack', 'email', 'discord', 'teams', 'github', 'stripe'),
+        'api': ('http', 'api'),
+        'database': ('database', 'sql'),
+        'schedule': ('schedule', 'cron'),
+    }
+
+    PREREQ_TEXT = {
+        'auth': ['Must authenticate with service', 'Need valid API credentials'],
+        'api': ['Understand REST API concepts', 'May need authentication token'],
+        'database': ['Understand database structure', 'Have database credentials'],
+        'schedule': ['Understand cron syntax or intervals', 'Know your timezone'],
+    }
+
+    # Node-id keywords driving the success/usage/rating estimators
+    SUCCESS_NODES = ('slack', 'email', 'set', 'webhook', 'http', 'filter')
+
+    USAGE_MAP = {
+        'set': 1000,
+        'webhook': 800,
+        'http': 750,
+        'switch': 600,
+        'slack': 500,
+        'email': 400,
+        'schedule': 350,
+        'filter': 300,
+    }
+
+    HIGH_RATED = ('slack', 'email', 'http', 'set', 'webhook')
+
+    # Single C-level alternation scans for the estimators (fallback path;
+    # the automaton covers these buckets when pyahocorasick is installed)
+    _USAGE_RE = re.compile('|'.join(USAGE_MAP))
+    _SUCCESS_RE = re.compile('|'.join(SUCCESS_NODES))
+    _RATING_RE = re.compile('|'.join(HIGH_RATED))
+
+    # Which keyword buckets are matched against which scan target
+    _TEXT_BUCKETS = frozenset({'category'})
+    _ID_BUCKETS = frozenset({'use_case', 'prereq', 'success', 'usage', 'rating'})
+    _TYPE_BUCKETS = frozenset({'tips', 'failure'})
+
+    _EASY_CURVE_KEYWORDS = ('send', 'get', 'fetch', 'trigger', 'simple')
+    _HARD_CURVE_KEYWORDS = ('condition', 'advanced', 'complex', 'transform', 'aggregate')
+
+    # Category names are shared across every node; pre-interning collapses
+    # the per-node category field to one str object per distinct value and
+    # makes downstream equality checks pointer compares
+    _INTERNED_CATS = {c: sys.intern(c) for c in CATEGORIES}
+    _INTERNED_CATS['Other'] = sys.intern('Other')
+
+    _automaton_cache = None
+    _needle_cache = None
+    _category_regex_cache = None
+
     def __init__(self, nodes_db_path: str):
         """
         Initialize entity extractor
@@ -200,123 +352,400 @@ class AgenticEntityExtractor:
         """
         self.nodes_db_path = Path(nodes_db_path)
         self.nodes_db = None
+        self._automaton = self._build_automaton() if HAS_AHOCORASICK else None
+
+    @classmethod
+    def _build_automaton(cls):
+        """
+        Build one Aho-Corasick automaton over every keyword bucket
+
+        Each word maps to a tuple of (bucket, key) tags so a single linear
+        pass over a node's text replaces the per-helper substring loops.
+        Built once per process and shared across instances.
+        """
+        if cls._automaton_cache is not None:
+            return cls._automaton_cache
+
+        words: Dict[str, List] = {}
+
+        def tag(word: str, bucket: str, key: str):
+            words.setdefault(word, []).append((bucket, key))
+
+        for category, kws in cls.CATEGORIES.items():
+            for kw in kws:
+                tag(kw, 'category', category)
+        for key in cls.USE_CASE_KEYWORDS:
+            tag(key, 'use_case', key)
+        for key in cls.AGENT_TIPS:
+            tag(key, 'tips', key)
+        for key in cls.FAILURE_MODES:
+            tag(key, 'failure', key)
+        for group, kws in cls.PREREQ_GROUPS.items():
+            for kw in kws:
+                tag(kw, 'prereq', group)
+        for kw in cls.SUCCESS_NODES:
+            tag(kw, 'success', kw)
+        for kw in cls.USAGE_MAP:
+            tag(kw, 'usage', kw)
+        for kw in cls.HIGH_RATED:
+            tag(kw, 'rating', kw)
+
+        automaton = ahocorasick.Automaton()
+        for word, tags in words.items():
+            automaton.add_word(word, tuple(tags))
+        automaton.make_automaton()
+
+        cls._automaton_cache = automaton
+        return automaton
+
+    @classmethod
+    def _build_category_regex(cls):
+        """
+        Compile one alternation regex over every CATEGORIES keyword
+
+        The alternation sits inside a zero-width lookahead so finditer
+        reports keywords at overlapping start positions (e.g. 'ai' inside
+        'wait') just like per-keyword substring scans. Alternatives follow
+        CATEGORIES declaration order, so when two keywords start at the
+        same offset the higher-priority category wins — which is the only
+        hit _categorize_node can act on anyway. Group names are synthetic
+        (c0, c1, ...) because category names like 'AI/ML' and 'File
+        Operations' are not valid regex group identifiers.
+        """
+        if cls._category_regex_cache is not None:
+            return cls._category_regex_cache
+
+        parts = []
+        group_to_category = {}
+        for i, (category, kws) in enumerate(cls.CATEGORIES.items()):
+            group = f"c{i}"
+            group_to_category[group] = category
+            parts.append(f"(?P<{group}>" + "|".join(map(re.escape, kws)) + ")")
+        pattern = re.compile("(?=(?:" + "|".join(parts) + "))")
+
+        cls._category_regex_cache = (pattern, group_to_category)
+        return cls._category_regex_cache
+
+    @classmethod
+    def _build_needle_table(cls):
+        """
+        Flatten the keyword buckets into per-target needle tuples
+
+        Returns (id_needles, type_needles), each a tuple of (needle,
+        bucket, key). The fallback scan in _collect_hits runs one flat
+        loop per target instead of nested per-bucket loops with fresh
+        generator objects on every call; category keywords are handled
+        by the compiled regex from _build_category_regex. Built once per
+        process.
+        """
+        if cls._needle_cache is not None:
+            return cls._needle_cache
+
+        id_needles = tuple(
+            [(key, 'use_case', key) for key in cls.USE_CASE_KEYWORDS]
+            + [(kw, 'prereq', group)
+               for group, kws in cls.PREREQ_GROUPS.items()
+               for kw in kws]
+        )
+        type_needles = tuple(
+            [(key, 'tips', key) for key in cls.AGENT_TIPS]
+            + [(key, 'failure', key) for key in cls.FAILURE_MODES]
+        )
+
+        cls._needle_cache = (id_needles, type_needles)
+        return cls._needle_cache
+
+    def _collect_hits(self, node_id_lower: str, node_type: str,
+                      combined_text: str) -> Dict[str, Set[str]]:
+        """
+        Collect keyword matches for every bucket in one pass per target
+
+        Returns a dict mapping bucket name to the set of matched keys.
+        Uses the automaton when pyahocorasick is installed; otherwise
+        falls back to plain substring scans with the same result shape.
+        """
+        hits: Dict[str, Set[str]] = {}
+
+        if self._automaton is not None:
+            for text, buckets in (
+                (combined_text, self._TEXT_BUCKETS),
+                (node_id_lower, self._ID_BUCKETS),
+                (node_type, self._TYPE_BUCKETS),
+            ):
+                for _, tags in self._automaton.iter(text):
+                    for bucket, key in tags:
+                        if bucket in buckets:
+                            hits.setdefault(bucket, set()).add(key)
+            return hits
+
+        # One compiled-regex pass categorizes against all 70 keywords
+        cat_re, group_to_category = self._build_category_regex()
+        cat_hits = {group_to_category[m.lastgroup]
+                    for m in cat_re.finditer(combined_text)}
+        if cat_hits:
+            hits['category'] = cat_hits
+
+        id_needles, type_needles = self._build_needle_table()
+        for target, needles in (
+            (node_id_lower, id_needles),
+            (node_type, type_needles),
+        ):
+            for needle, bucket, key in needles:
+                if needle in target:
+                    hits.setdefault(bucket, set()).add(key)
+        if self._SUCCESS_RE.search(node_id_lower):
+            hits['success'] = {'hit'}
+        usage_keys = set(self._USAGE_RE.findall(node_id_lower))
+        if usage_keys:
+            hits['usage'] = usage_keys
+        if self._RATING_RE.search(node_id_lower):
+            hits['rating'] = {'hit'}
+        return hits
 
     def extract_all_nodes(self) -> List[AgenticNode]:
         """Extract all n8n nodes with agent-friendly metadata"""
         try:
-            logger.info(f"Extracting nodes from {self.nodes_db_path}")
+            return list(self._extracted_nodes())
+        except Exception as e:
+            logger.error(f"Failed to extract nodes: {e}")
+            return []
 
-            # Connect to n8n database
-            if not self.nodes_db_path.exists():
-                logger.warning(f"Database not found at {self.nodes_db_path}, returning empty list")
-                return []
+    def extract_all_nodes_table(self) -> 'AgenticNodeTable':
+        """Extract all nodes into a columnar AgenticNodeTable
+
+        Streams each enriched node straight into aligned columns, so the
+        full list of AgenticNode instances is never held alongside the
+        table. Prefer this for consumers that work column-at-a-time
+        (embedding encode over labels, bulk category stats).
+        """
+        table = AgenticNodeTable()
+        try:
+            for node in self._extracted_nodes():
+                table.append(node)
+        except Exception as e:
+            logger.error(f"Failed to extract nodes: {e}")
+        return table
+
+    def _extracted_nodes(self):
+        """Yield enriched nodes from the database one at a time"""
+        logger.info(f"Extracting nodes from {self.nodes_db_path}")
+
+        # Connect to n8n database
+        if not self.nodes_db_path.exists():
+            logger.warning(f"Database not found at {self.nodes_db_path}, returning empty list")
+            return
+
+        # Read-only URI open skips write-lock acquisition; the pragmas
+        # turn the full-table scan into memory reads (256MB mmap, 64MB
+        # page cache) with journal/sync overhead disabled — safe because
+        # this connection never writes.
+        conn = sqlite3.connect(f"file:{self.nodes_db_path}?mode=ro", uri=True)
+        try:
+            conn.execute("PRAGMA query_only = ON")
+            conn.execute("PRAGMA mmap_size = 268435456")
+            conn.execute("PRAGMA cache_size = -65536")
+            conn.execute("PRAGMA temp_store = MEMORY")
+            conn.execute("PRAGMA synchronous = OFF")
 
-            conn = sqlite3.connect(str(self.nodes_db_path))
-            conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
+            cursor.arraysize = 1000
+
+            total_rows = cursor.execute("SELECT COUNT(*) FROM nodes").fetchone()[0]
 
-            # Query all nodes
+            # Name the columns and index positionally: no sqlite3.Row
+            # per-column lookups and no full-result materialization.
+            # The JSON1 extension extracts property/operation keys
+            # server-side so the full blobs never cross into Python;
+            # json_valid guards rows with malformed or NULL payloads.
             cursor.execute("""
-                SELECT * FROM nodes
+                SELECT id, label, description,
+                    CASE WHEN json_valid(properties) AND json_type(properties) = 'object'
+                         THEN (SELECT json_group_array(key) FROM json_each(properties))
+                         ELSE NULL END AS prop_keys,
+                    CASE WHEN json_valid(operations) THEN
+                        CASE json_type(operations)
+                            WHEN 'object' THEN (SELECT json_group_array(key) FROM json_each(operations))
+                            WHEN 'array' THEN (SELECT json_group_array(value) FROM json_each(operations))
+                            ELSE NULL
+                        END
+                    ELSE NULL END AS op_keys,
+                    metadata
+                FROM nodes
                 ORDER BY label ASC
             """)
-            rows = cursor.fetchall()
-            conn.close()
-
-            nodes = []
-            for row in rows:
-                node_dict = dict(row)
-                agentic_node = self._enrich_node(node_dict)
-                nodes.append(agentic_node)
 
-                if len(nodes) % 50 == 0:
-                    logger.info(f"Extracted {len(nodes)} nodes...")
-
-            logger.info(f"Successfully extracted {len(nodes)} nodes")
-            return nodes
-
-        except Exception as e:
-            logger.error(f"Failed to extract nodes: {e}")
-            return []
+            count = 0
+            if total_rows >= _PARALLEL_ROW_THRESHOLD:
+                # Enrichment is pure-Python and CPU-bound: shard row chunks
+                # across processes and rebuild dataclasses in order
+                def chunks():
+                    while True:
+                        rows = cursor.fetchmany(_ENRICH_CHUNK_ROWS)
+                        if not rows:
+                            return
+                        yield rows
+
+                with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+                    for chunk_dicts in executor.map(_enrich_chunk, chunks()):
+                        for d in chunk_dicts:
+                            yield AgenticNode.from_dict(d)
+                        count += len(chunk_dicts)
+                        logger.info(f"Extracted {count} nodes...")
+            else:
+                while True:
+                    rows = cursor.fetchmany(1000)
+                    if not rows:
+                        break
+
+                    # Complexity/learning-curve are computed columnarly for
+                    # the whole batch rather than per row
+                    complexities, curves = self._batch_complexity_curves(
+                        [row[2] for row in rows]
+                    )
+
+                    # Unpack cursor tuples positionally: no per-row dict
+                    # allocation or key hashing
+                    for row, cx, curve in zip(rows, complexities, curves):
+                        yield self._enrich_row(*row, cx, curve)
+                        count += 1
+
+                        if count % 50 == 0:
+                            logger.info(f"Extracted {count} nodes...")
+
+            logger.info(f"Successfully extracted {count} nodes")
+        finally:
+            conn.close()
 
-    def _enrich_node(self, node_data: Dict) -> AgenticNode:
+    def _enrich_node(self, node_data: Dict, complexity: str = None,
+                     learning_curve: str = None) -> AgenticNode:
         """
         Enrich node data with agent-friendly metadata
 
+        Thin dict adapter over _enrich_row for callers holding full node
+        payloads; the extraction loops unpack cursor tuples straight into
+        _enrich_row without building a dict per row.
+
         Args:
             node_data: Raw node data from database
+            complexity: Precomputed complexity from a batched pass, if any
+            learning_curve: Precomputed learning curve, if any
 
         Returns:
             AgenticNode with enriched metadata
         """
         node_id = node_data.get('id', '')
-        label = node_data.get('label', node_id)
-        description = node_data.get('description', '')
+        return self._enrich_row(
+            node_id,
+            node_data.get('label', node_id),
+            node_data.get('description', ''),
+            node_data.get('properties'),
+            node_data.get('operations'),
+            node_data.get('metadata'),
+            complexity,
+            learning_curve,
+        )
+
+    def _enrich_row(self, node_id: str, label: str, description: str,
+                    properties, operations, metadata,
+                    complexity: str = None,
+                    learning_curve: str = None) -> AgenticNode:
+        """Enrich one positionally-unpacked database row into an AgenticNode"""
+        node_id = node_id or ''
+        label = label if label is not None else node_id
+        description = description or ''
+
+        # Lowercase/split once per node; every helper below reuses these
+        node_id_lower = node_id.lower()
+        node_type = node_id_lower.rsplit('.', 1)[-1]
+        label_lower = label.lower()
+        description_lower = (description or '').lower()
+        combined_text = f"{node_id_lower} {label_lower} {description_lower}"
+        hits = self._collect_hits(node_id_lower, node_type, combined_text)
+
+        # The metadata column arrives as a JSON TEXT blob; parse it like
+        # properties/operations and fall back to {} on malformed payloads
+        # so to_dict's dict(self.metadata) never sees a string
+        if isinstance(metadata, str):
+            try:
+                metadata = _json_loads(metadata)
+            except Exception:
+                metadata = None
+        if not isinstance(metadata, dict):
+            metadata = None
 
         # Extract basic info
         agentic_node = AgenticNode(
             id=node_id,
             label=label,
             description=description,
-            category=self._categorize_node(node_id, label, description),
-            keywords=self._extract_keywords(node_id, label, description),
-            use_cases=self._extract_use_cases(node_id, description),
-            prerequisites=self._extract_prerequisites(node_id, label),
-            agent_tips=self._get_agent_tips(node_id),
-            failure_modes=self._get_failure_modes(node_id),
-            common_configurations=self._get_common_configurations(node_id),
-            complexity=self._determine_complexity(description),
-            learning_curve=self._determine_learning_curve(description),
-            properties=self._extract_properties(node_data),
-            operations=self._extract_operations(node_data),
-            success_rate=self._estimate_success_rate(node_id),
-            usage_frequency=self._estimate_usage_frequency(node_id),
-            average_rating=self._estimate_rating(node_id),
-            metadata=node_data.get('metadata', {})
+            category=self._categorize_node(hits),
+            keywords=self._extract_keywords(label_lower, description_lower, node_type),
+            use_cases=self._extract_use_cases(node_id, description, hits),
+            prerequisites=self._extract_prerequisites(hits),
+            agent_tips=self._get_agent_tips(node_type, hits),
+            failure_modes=self._get_failure_modes(hits),
+            common_configurations=self._get_common_configurations(node_type),
+            # Batched np.select values are fresh str objects per row;
+            # interning shares one object per distinct level
+            complexity=sys.intern(
+                complexity or self._determine_complexity(description)),
+            learning_curve=sys.intern(
+                learning_curve or self._determine_learning_curve(description)),
+            properties=self._extract_properties(properties),
+            operations=self._extract_operations(operations),
+            success_rate=self._estimate_success_rate(hits),
+            usage_frequency=self._estimate_usage_frequency(hits),
+            average_rating=self._estimate_rating(hits),
+            metadata=metadata or {}
         )
 
         return agentic_node
 
-    def _categorize_node(self, node_id: str, label: str, description: str) -> str:
-        """Determine node category"""
-        combined_text = f"{node_id} {label} {description}".lower()
-
-        for category, keywords in self.CATEGORIES.items():
-            if any(kw in combined_text for kw in keywords):
-                return category
+    def _categorize_node(self, hits: Dict[str, Set[str]]) -> str:
+        """Determine node category from the pre-collected match set"""
+        cat_hits = hits.get('category')
+        if cat_hits:
+            # Preserve CATEGORIES declaration order as match priority
+            for category in self.CATEGORIES:
+                if category in cat_hits:
+                    return self._INTERNED_CATS[category]
 
-        return "Other"
+        return self._INTERNED_CATS['Other']
 
-    def _extract_keywords(self, node_id: str, label: str, description: str) -> List[str]:
+    def _extract_keywords(self, label_lower: str, description_lower: str,
+                          node_type: str) -> List[str]:
         """Extract keywords from node information"""
         keywords = set()
 
         # Add label as keyword
-        keywords.add(label.lower())
+        keywords.add(label_lower)
 
         # Extract from description
-        if description:
+        if description_lower:
             # Split by common separators
-            words = re.split(r'[\s,;:\-\(\)\[\]\.]+', description.lower())
+            words = description_lower.translate(_SEP_TABLE).split()
             # Keep meaningful words (>3 chars)
-            words = [w for w in words if len(w) > 3 and w not in ['the', 'and', 'with', 'from', 'that', 'this', 'for', 'your']]
+            words = [w for w in words if len(w) > 3 and w not in _STOPWORDS]
             keywords.update(words[:10])  # Limit to 10
 
         # Add node-specific keywords
-        node_type = node_id.split('.')[-1].lower()
         keywords.add(node_type)
 
-        return sorted(list(keywords))[:15]  # Limit to 15 keywords
+        # First 15 lexicographic entries in O(N log 15), no full sort
+        return heapq.nsmallest(15, keywords)
 
-    def _extract_use_cases(self, node_id: str, description: str) -> List[str]:
+    def _extract_use_cases(self, node_id: str, description: str,
+                           hits: Dict[str, Set[str]]) -> List[str]:
         """Extract use cases agents care about"""
         use_cases = []
 
         # Check predefined use cases
-        for node_type, cases in self.USE_CASE_KEYWORDS.items():
-            if node_type in node_id.lower():
-                use_cases.extend(cases)
-                break
+        uc_hits = hits.get('use_case')
+        if uc_hits:
+            for node_type, cases in self.USE_CASE_KEYWORDS.items():
+                if node_type in uc_hits:
+                    use_cases.extend(cases)
+                    break
 
         # If no predefined, generate from description
         if not use_cases and description:
@@ -327,104 +756,23 @@ class AgenticEntityExtractor:
 
         return use_cases[:5]  # Limit to 5 use cases
 
-    def _extract_prerequisites(self, node_id: str, label: str) -> List[str]:
+    def _extract_prerequisites(self, hits: Dict[str, Set[str]]) -> List[str]:
         """Extract prerequisites agents need to know"""
-        prerequisites = []
-
-        node_type = node_id.lower()
-
-        # Add generic prerequisites
-        if any(auth in node_type for auth in ['slack', 'email', 'discord', 'teams', 'github', 'stripe']):
-            prerequisites.append("Must authenticate with service")
-            prerequisites.append("Need valid API credentials")
+        return list(_prerequisites_for(frozenset(hits.get('prereq', ()))))
 
-        if 'http' in node_type or 'api' in node_type:
-            prerequisites.append("Understand REST API concepts")
-            prerequisites.append("May need authentication token")
-
-        if 'database' in node_type or 'sql' in node_type:
-            prerequisites.append("Understand database structure")
-            prerequisites.append("Have database credentials")
-
-        if 'schedule' in node_type or 'cron' in node_type:
-            prerequisites.append("Understand cron syntax or intervals")
-            prerequisites.append("Know your timezone")
-
-        return prerequisites[:4]  # Limit to 4 prerequisites
-
-    def _get_agent_tips(self, node_id: str) -> List[str]:
+    def _get_agent_tips(self, node_type: str, hits: Dict[str, Set[str]]) -> List[str]:
         """Get agent tips for this node"""
-        node_type = node_id.split('.')[-1].lower()
+        return list(_agent_tips_for(node_type, frozenset(hits.get('tips', ()))))
 
-        # Check for predefined tips
-        for key, tips in self.AGENT_TIPS.items():
-            if key in node_type:
-                return tips[:3]  # Return top 3 tips
-
-        # Default tips
-        return [
-            f"Test {node_type} configuration before production use",
-            f"Check {node_type} documentation for all options",
-            f"Monitor {node_type} logs for debugging"
-        ]
-
-    def _get_failure_modes(self, node_id: str) -> List[str]:
+    def _get_failure_modes(self, hits: Dict[str, Set[str]]) -> List[str]:
         """Get common failure modes for this node"""
-        node_type = node_id.split('.')[-1].lower()
-
-        # Check for predefined failure modes
-        for key, modes in self.FAILURE_MODES.items():
-            if key in node_type:
-                return modes[:3]  # Return top 3 failure modes
-
-        # Default failure modes
-        return [
-            f"Configuration missing required fields",
-            f"Upstream data format unexpected",
-            f"External service unavailable"
-        ]
+        return list(_failure_modes_for(frozenset(hits.get('failure', ()))))
 
-    def _get_common_configurations(self, node_id: str) -> Dict[str, Dict]:
+    def _get_common_configurations(self, node_type: str) -> Dict[str, Dict]:
         """Get common configurations agents use"""
-        configs = {}
-
-        node_type = node_id.split('.')[-1].lower()
-
-        # Slack common configs
-        if 'slack' in node_type:
-            configs['notification'] = {
-                'channel': '#alerts',
-                'text': 'Notification from workflow'
-            }
-            configs['report'] = {
-                'channel': '#reports',
-                'text': 'Daily Report'
-            }
-
-        # HTTP common configs
-        elif 'http' in node_type:
-            configs['get_request'] = {
-                'method': 'GET',
-                'url': 'https://api.example.com/data'
-            }
-            configs['post_request'] = {
-                'method': 'POST',
-                'url': 'https://api.example.com/data',
-                'body_type': 'JSON'
-            }
-
-        # Schedule common configs
-        elif 'schedule' in node_type:
-            configs['daily_9am'] = {
-                'mode': 'Cron',
-                'cron': '0 9 * * *'
-            }
-            configs['every_hour'] = {
-                'mode': 'Every Hour',
-                'interval': 60
-            }
-
-        return configs
+        # Copy the cached entry so callers can mutate their own dict
+        return {name: dict(config)
+                for name, config in _common_configurations_for(node_type)}
 
     def _determine_complexity(self, description: str) -> str:
         """Determine node complexity level"""
@@ -445,39 +793,73 @@ class AgenticEntityExtractor:
         if not description:
             return "medium"
 
-        complex_keywords = ['condition', 'advanced', 'complex', 'transform', 'aggregate']
-        easy_keywords = ['send', 'get', 'fetch', 'trigger', 'simple']
-
         desc_lower = description.lower()
 
-        if any(kw in desc_lower for kw in easy_keywords):
+        if any(kw in desc_lower for kw in self._EASY_CURVE_KEYWORDS):
             return "easy"
-        elif any(kw in desc_lower for kw in complex_keywords):
+        elif any(kw in desc_lower for kw in self._HARD_CURVE_KEYWORDS):
             return "hard"
         else:
             return "medium"
 
-    def _extract_properties(self, node_data: Dict) -> List[str]:
-        """Extract property names from node"""
+    @classmethod
+    def _batch_complexity_curves(cls, descriptions: List[str]):
+        """
+        Vectorized complexity/learning-curve over a batch of descriptions
+
+        Replaces per-row split()/keyword scans with a handful of columnar
+        NumPy ops per fetchmany batch. Returns two aligned lists matching
+        _determine_complexity/_determine_learning_curve row for row.
+        """
+        empty = np.array([not d for d in descriptions], dtype=bool)
+        word_counts = np.fromiter(
+            (len(d.split()) if d else 0 for d in descriptions),
+            dtype=np.int64, count=len(descriptions)
+        )
+        complexity = np.select(
+            [empty, word_counts < 20, word_counts < 50],
+            ['medium', 'simple', 'medium'], default='complex'
+        )
+
+        lowered = np.array([d.lower() if d else '' for d in descriptions], dtype=str)
+        easy = np.zeros(len(descriptions), dtype=bool)
+        for kw in cls._EASY_CURVE_KEYWORDS:
+            easy |= np.char.find(lowered, kw) >= 0
+        hard = np.zeros(len(descriptions), dtype=bool)
+        for kw in cls._HARD_CURVE_KEYWORDS:
+            hard |= np.char.find(lowered, kw) >= 0
+        curve = np.select([empty, easy, hard], ['medium', 'easy', 'hard'],
+                          default='medium')
+
+        return complexity.tolist(), curve.tolist()
+
+    def _extract_properties(self, raw) -> List[str]:
+        """Extract property names from a raw properties column value
+
+        Handles both the server-side extracted key array and a raw
+        properties object for callers passing full node payloads.
+        """
         properties = []
 
         try:
-            if 'properties' in node_data and node_data['properties']:
-                props = json.loads(node_data['properties']) if isinstance(node_data['properties'], str) else node_data['properties']
+            if raw:
+                props = _json_loads(raw) if isinstance(raw, str) else raw
                 if isinstance(props, dict):
                     properties = list(props.keys())[:10]  # Limit to 10
+                elif isinstance(props, list):
+                    properties = props[:10]  # Pre-extracted key array
         except:
             pass
 
         return properties
 
-    def _extract_operations(self, node_data: Dict) -> List[str]:
-        """Extract operations from node"""
+    def _extract_operations(self, raw) -> List[str]:
+        """Extract operations from a raw operations column value"""
         operations = []
 
         try:
-            if 'operations' in node_data and node_data['operations']:
-                ops = json.loads(node_data['operations']) if isinstance(node_data['operations'], str) else node_data['operations']
+            if raw:
+                ops = _json_loads(raw) if isinstance(raw, str) else raw
                 if isinstance(ops, (list, dict)):
                     operations = ops if isinstance(ops, list) else list(ops.keys())
                     operations = operations[:10]  # Limit to 10
@@ -486,54 +868,249 @@ class AgenticEntityExtractor:
 
         return operations
 
-    def _estimate_success_rate(self, node_id: str) -> float:
+    def _estimate_success_rate(self, hits: Dict[str, Set[str]]) -> float:
         """Estimate success rate based on node type"""
         # Common nodes have high success rates
-        common_nodes = ['slack', 'email', 'set', 'webhook', 'http', 'filter']
-        if any(cn in node_id.lower() for cn in common_nodes):
+        if hits.get('success'):
             return 0.95
 
         # Most nodes have decent success rates
         return 0.85
 
-    def _estimate_usage_frequency(self, node_id: str) -> int:
+    def _estimate_usage_frequency(self, hits: Dict[str, Set[str]]) -> int:
         """Estimate how often this node is used"""
         # Common nodes used more frequently
-        usage_map = {
-            'set': 1000,
-            'webhook': 800,
-            'http': 750,
-            'switch': 600,
-            'slack': 500,
-            'email': 400,
-            'schedule': 350,
-            'filter': 300,
-        }
-
-        for key, count in usage_map.items():
-            if key in node_id.lower():
-                return count
+        usage_hits = hits.get('usage')
+        if usage_hits:
+            for key, count in self.USAGE_MAP.items():
+                if key in usage_hits:
+                    return count
 
         return 100  # Default for unknown nodes
 
-    def _estimate_rating(self, node_id: str) -> float:
+    def _estimate_rating(self, hits: Dict[str, Set[str]]) -> float:
         """Estimate average rating based on node type"""
         # Popular, reliable nodes have higher ratings
-        high_rated = ['slack', 'email', 'http', 'set', 'webhook']
-        if any(hr in node_id.lower() for hr in high_rated):
+        if hits.get('rating'):
             return 4.7
 
         # Most nodes have decent ratings
         return 4.2
 
     def save_to_json(self, nodes: List[AgenticNode], output_path: str) -> bool:
-        """Save extracted nodes to JSON"""
+        """Save extracted nodes to a JSON array, streamed node by node
+
+        Only one node dict is materialized at a time, so peak memory no
+        longer doubles with a full list-of-dicts copy before the dump.
+        """
+        try:
+            with open(output_path, 'wb', buffering=1 << 20) as f:
+                f.write(b'[')
+                for i, node in enumerate(nodes):
+                    if i:
+                        f.write(b',\n')
+                    f.write(_json_dump_bytes(node.to_dict()))
+                f.write(b']')
+            logger.info(f"Saved {len(nodes)} nodes to {output_path}")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to save nodes: {e}")
+            return False
+
+    def save_to_ndjson(self, nodes: List[AgenticNode], output_path: str) -> bool:
+        """Save extracted nodes as newline-delimited JSON"""
         try:
-            data = [node.to_dict() for node in nodes]
-            with open(output_path, 'w') as f:
-                json.dump(data, f, indent=2, default=str)
+            with open(output_path, 'wb', buffering=1 << 20) as f:
+                for node in nodes:
+                    f.write(_json_dump_bytes(node.to_dict()))
+                    f.write(b'\n')
             logger.info(f"Saved {len(nodes)} nodes to {output_path}")
             return True
         except Exception as e:
             logger.error(f"Failed to save nodes: {e}")
             return False
+
+
+class AgenticNodeTable:
+    """
+    Columnar (structure-of-arrays) store of extracted nodes
+
+    Downstream consumers (indexers, embedders) mostly want whole columns
+    ("all labels", "all categories") rather than row objects, so aligned
+    columns avoid walking dataclass fields per node and feed batch work
+    directly (e.g. embedding encode over .labels). Categories are stored
+    as uint8 codes into CATEGORY_NAMES; .row(i) materializes a single
+    AgenticNode for the rare row-at-a-time case.
+    """
+
+    CATEGORY_NAMES = tuple(AgenticEntityExtractor.CATEGORIES) + ('Other',)
+    _CATEGORY_CODE = {name: code for code, name in enumerate(CATEGORY_NAMES)}
+    _OTHER_CODE = _CATEGORY_CODE['Other']
+
+    __slots__ = (
+        'ids', 'labels', 'descriptions', 'category_codes', 'keywords',
+        'use_cases', 'prerequisites', 'agent_tips', 'failure_modes',
+        'common_configurations', 'complexities', 'learning_curves',
+        'properties', 'operations', 'success_rates', 'usage_frequencies',
+        'average_ratings', 'metadata',
+    )
+
+    def __init__(self):
+        self.ids: List[str] = []
+        self.labels: List[str] = []
+        self.descriptions: List[str] = []
+        self.category_codes: List[int] = []
+        self.keywords: List[List[str]] = []
+        self.use_cases: List[List[str]] = []
+        self.prerequisites: List[List[str]] = []
+        self.agent_tips: List[List[str]] = []
+        self.failure_modes: List[List[str]] = []
+        self.common_configurations: List[List[Dict]] = []
+        self.complexities: List[str] = []
+        self.learning_curves: List[str] = []
+        self.properties: List[List[str]] = []
+        self.operations: List[List[str]] = []
+        self.success_rates: List[float] = []
+        self.usage_frequencies: List[int] = []
+        self.average_ratings: List[float] = []
+        self.metadata: List[Dict] = []
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def append(self, node: AgenticNode):
+        """Append one node's fields onto the aligned columns"""
+        self.ids.append(node.id)
+        self.labels.append(node.label)
+        self.descriptions.append(node.description)
+        self.category_codes.append(
+            self._CATEGORY_CODE.get(node.category, self._OTHER_CODE))
+        self.keywords.append(node.keywords)
+        self.use_cases.append(node.use_cases)
+        self.prerequisites.append(node.prerequisites)
+        self.agent_tips.append(node.agent_tips)
+        self.failure_modes.append(node.failure_modes)
+        self.common_configurations.append(node.common_configurations)
+        self.complexities.append(node.complexity)
+        self.learning_curves.append(node.learning_curve)
+        self.properties.append(node.properties)
+        self.operations.append(node.operations)
+        self.success_rates.append(node.success_rate)
+        self.usage_frequencies.append(node.usage_frequency)
+        self.average_ratings.append(node.average_rating)
+        self.metadata.append(node.metadata)
+
+    def category_array(self) -> np.ndarray:
+        """Category codes as a uint8 array for vectorized stats"""
+        return np.fromiter(self.category_codes, dtype=np.uint8,
+                           count=len(self.category_codes))
+
+    def categories(self) -> List[str]:
+        """Category names decoded from the code column"""
+        names = self.CATEGORY_NAMES
+        return [names[code] for code in self.category_codes]
+
+    def row(self, i: int) -> AgenticNode:
+        """Materialize one row as an AgenticNode"""
+        return AgenticNode(
+            id=self.ids[i],
+            label=self.labels[i],
+            description=self.descriptions[i],
+            category=self.CATEGORY_NAMES[self.category_codes[i]],
+            keywords=self.keywords[i],
+            use_cases=self.use_cases[i],
+            prerequisites=self.prerequisites[i],
+            agent_tips=self.agent_tips[i],
+            failure_modes=self.failure_modes[i],
+            common_configurations=self.common_configurations[i],
+            complexity=self.complexities[i],
+            learning_curve=self.learning_curves[i],
+            properties=self.properties[i],
+            operations=self.operations[i],
+            success_rate=self.success_rates[i],
+            usage_frequency=self.usage_frequencies[i],
+            average_rating=self.average_ratings[i],
+            metadata=self.metadata[i],
+        )
+
+    @classmethod
+    def from_nodes(cls, nodes: List[AgenticNode]) -> 'AgenticNodeTable':
+        """Build a table from an existing list of nodes"""
+        table = cls()
+        for node in nodes:
+            table.append(node)
+        return table
+
+
+# Per-type enrichment, memoized: many n8n nodes share the same type suffix
+# and match sets, so N per-node calls collapse into ~K unique-profile calls.
+# The cached values are immutable tuples; wrappers copy into lists/dicts.
+
+@lru_cache(maxsize=512)
+def _prerequisites_for(prereq_groups: frozenset) -> tuple:
+    """Prerequisite lines for a frozen set of matched groups"""
+    prerequisites = []
+    for group, lines in AgenticEntityExtractor.PREREQ_TEXT.items():
+        if group in prereq_groups:
+            prerequisites.extend(lines)
+    return tuple(prerequisites[:4])  # Limit to 4 prerequisites
+
+
+@lru_cache(maxsize=512)
+def _agent_tips_for(node_type: str, tip_keys: frozenset) -> tuple:
+    """Agent tips for a node type and its matched tip keys"""
+    if tip_keys:
+        for key, tips in AgenticEntityExtractor.AGENT_TIPS.items():
+            if key in tip_keys:
+                return tuple(tips[:3])  # Return top 3 tips
+
+    # Default tips
+    return (
+        f"Test {node_type} configuration before production use",
+        f"Check {node_type} documentation for all options",
+        f"Monitor {node_type} logs for debugging",
+    )
+
+
+@lru_cache(maxsize=512)
+def _failure_modes_for(failure_keys: frozenset) -> tuple:
+    """Failure modes for a frozen set of matched keys"""
+    if failure_keys:
+        for key, modes in AgenticEntityExtractor.FAILURE_MODES.items():
+            if key in failure_keys:
+                return tuple(modes[:3])  # Return top 3 failure modes
+
+    # Default failure modes
+    return (
+        "Configuration missing required fields",
+        "Upstream data format unexpected",
+        "External service unavailable",
+    )
+
+
+@lru_cache(maxsize=512)
+def _common_configurations_for(node_type: str) -> tuple:
+    """Common configurations for a node type as (name, config) pairs"""
+    # Slack common configs
+    if 'slack' in node_type:
+        return (
+            ('notification', {'channel': '#alerts', 'text': 'Notification from workflow'}),
+            ('report', {'channel': '#reports', 'text': 'Daily Report'}),
+        )
+
+    # HTTP common configs
+    if 'http' in node_type:
+        return (
+            ('get_request', {'method': 'GET', 'url': 'https://api.example.com/data'}),
+            ('post_request', {'method': 'POST', 'url': 'https://api.example.com/data',
+                              'body_type': 'JSON'}),
+        )
+
+    # Schedule common configs
+    if 'schedule' in node_type:
+        return (
+            ('daily_9am', {'mode': 'Cron', 'cron': '0 9 * * *'}),
+            ('every_hour', {'mode': 'Every Hour', 'interval': 60}),
+        )
+
+    return ()
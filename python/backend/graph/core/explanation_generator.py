@@ -13,6 +13,7 @@ Agent-Focused Features:
 - Success rate and confidence justification
 """
 
+import functools
 from dataclasses import dataclass
 from typing import List, Dict, Optional
 from enum import Enum
@@ -64,6 +65,22 @@ class ExplanationGenerator:
             db: Database instance
         """
         self.db = db
+        # Hot nodes recur across explanations in a session; memoizing
+        # turns repeat lookups into dict hits instead of SQLite queries
+        self._get_node = functools.lru_cache(maxsize=4096)(db.get_node)
+        # Explanations are deterministic given their inputs, so repeat
+        # requests come straight from cache with no DB or format work
+        self._integration_explanation = functools.lru_cache(maxsize=2048)(
+            self._build_integration_explanation)
+        self._search_explanations: Dict[tuple, Explanation] = {}
+
+    _SEARCH_CACHE_MAX = 2048
+
+    def invalidate(self):
+        """Clear lookup and explanation caches after graph updates"""
+        self._get_node.cache_clear()
+        self._integration_explanation.cache_clear()
+        self._search_explanations.clear()
 
     async def explain_search_result(
         self,
@@ -78,86 +95,79 @@ class ExplanationGenerator:
         Returns:
             Explanation object with natural language description
         """
-        try:
-            # Build reasoning steps
-            reasoning = []
-
-            if result.similarity_score > 0:
-                reasoning.append(
-                    f"Semantic match with {result.confidence:.0%} confidence "
-                    f"({result.similarity_score:.2f} similarity score)"
-                )
-
-            if result.relevance_score > 0:
-                reasoning.append(
-                    f"Keyword relevance of {result.relevance_score:.0%} "
-                    f"based on query match"
-                )
-
-            # Build detailed explanation
-            details = f"The {result.node_label} node is recommended for your search. "
-
-            if result.use_cases:
-                details += f"It's commonly used for: {', '.join(result.use_cases[:2])}. "
-
-            if result.category:
-                details += f"This node belongs to the {result.category} category. "
-
-            if result.description:
-                details += f"Details: {result.description} "
-
-            # Build caveats
-            caveats = []
-
-            if result.failure_modes:
-                caveats.extend([
-                    f"⚠️ Common mistake: {mode}"
-                    for mode in result.failure_modes[:2]
-                ])
-
-            if result.prerequisites:
-                caveats.append(
-                    f"Prerequisites: {', '.join(result.prerequisites[:2])}"
-                )
-
-            # Build next steps
-            next_steps = []
-
-            if result.agent_tips:
-                next_steps.extend([
-                    f"💡 Tip: {tip}"
-                    for tip in result.agent_tips[:2]
-                ])
-
-            if result.related_nodes:
-                next_steps.append(
-                    f"Consider also checking: {', '.join(result.related_nodes[:3])}"
-                )
-
-            return Explanation(
-                type=ExplanationType.SEARCH_MATCH,
-                summary=f"Recommended: {result.node_label} ({result.category})",
-                detailed=details,
-                confidence=result.confidence,
-                reasoning_steps=reasoning,
-                caveats=caveats,
-                examples=result.use_cases[:3],
-                next_steps=next_steps,
+        cache_key = (result.node_id, round(result.similarity_score, 3),
+                     round(result.relevance_score, 3))
+        cached = self._search_explanations.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # Pure formatting over the SearchResult — no DB calls, so no
+        # exception scope on the fast path
+        reasoning = []
+
+        if result.similarity_score > 0:
+            reasoning.append(
+                f"Semantic match with {result.confidence:.0%} confidence "
+                f"({result.similarity_score:.2f} similarity score)"
             )
 
-        except Exception as e:
-            logger.error(f"Error explaining search result: {e}")
-            return Explanation(
-                type=ExplanationType.SEARCH_MATCH,
-                summary="Search result found",
-                detailed="Unable to generate detailed explanation",
-                confidence=0.0,
-                reasoning_steps=[],
-                caveats=["Error generating explanation"],
-                examples=[],
-                next_steps=[],
+        if result.relevance_score > 0:
+            reasoning.append(
+                f"Keyword relevance of {result.relevance_score:.0%} "
+                f"based on query match"
+            )
+
+        # Build detailed explanation (join once, no repeated +=)
+        parts = [f"The {result.node_label} node is recommended for your search."]
+
+        if result.use_cases:
+            parts.append(f"It's commonly used for: {', '.join(result.use_cases[:2])}.")
+
+        if result.category:
+            parts.append(f"This node belongs to the {result.category} category.")
+
+        if result.description:
+            parts.append(f"Details: {result.description}")
+
+        details = " ".join(parts) + " "
+
+        # Build caveats
+        caveats = [
+            f"⚠️ Common mistake: {mode}"
+            for mode in result.failure_modes[:2]
+        ]
+
+        if result.prerequisites:
+            caveats.append(
+                f"Prerequisites: {', '.join(result.prerequisites[:2])}"
             )
 
+        # Build next steps
+        next_steps = [
+            f"💡 Tip: {tip}"
+            for tip in result.agent_tips[:2]
+        ]
+
+        if result.related_nodes:
+            next_steps.append(
+                f"Consider also checking: {', '.join(result.related_nodes[:3])}"
+            )
+
+        explanation = Explanation(
+            type=ExplanationType.SEARCH_MATCH,
+            summary=f"Recommended: {result.node_label} ({result.category})",
+            detailed=details,
+            confidence=result.confidence,
+            reasoning_steps=reasoning,
+            caveats=caveats,
+            examples=result.use_cases[:3],
+            next_steps=next_steps,
+        )
+        if len(self._search_explanations) >= self._SEARCH_CACHE_MAX:
+            self._search_explanations.clear()
+        self._search_explanations[cache_key] = explanation
+        return explanation
+
     async def explain_path(
         self,
         path: Path,
@@ -175,66 +185,52 @@ class ExplanationGenerator:
         Returns:
             Explanation of the path
         """
-        try:
-            reasoning = [
-                f"Path found with {path.length} connections",
-                f"Total confidence: {path.confidence:.0%}",
-                f"Path strength: {path.total_strength:.2f}",
-            ]
-
-            # Build node sequence explanation
-            node_names = []
-            for node_id in path.nodes:
-                try:
-                    node = self.db.get_node(node_id)
-                    if node:
-                        node_names.append(node.label)
-                except:
-                    node_names.append(node_id)
-
-            details = (
-                f"Integration path from {start_node.label} to {end_node.label}: "
-                f"{' → '.join(node_names)}. "
-                f"This sequence represents a {path.length}-step workflow. "
-                f"Each connection has been validated as working in real n8n workflows."
-            )
-
-            caveats = []
-            if path.length > 3:
-                caveats.append("⚠️ This is a long path - consider if a shorter route exists")
-
-            if path.confidence < 0.7:
-                caveats.append("⚠️ Confidence is moderate - test thoroughly before deploying")
-
-            next_steps = [
-                f"Use {', '.join(node_names[1:-1])} as intermediate steps",
-                "Configure data mapping between each connection",
-                "Test each step individually before running full workflow",
-            ]
-
-            return Explanation(
-                type=ExplanationType.PATH_CONNECTION,
-                summary=f"Integration path: {start_node.label} → {end_node.label}",
-                detailed=details,
-                confidence=path.confidence,
-                reasoning_steps=reasoning,
-                caveats=caveats,
-                examples=[],
-                next_steps=next_steps,
-            )
-
-        except Exception as e:
-            logger.error(f"Error explaining path: {e}")
-            return Explanation(
-                type=ExplanationType.PATH_CONNECTION,
-                summary="Path explanation unavailable",
-                detailed="Unable to generate path explanation",
-                confidence=0.0,
-                reasoning_steps=[],
-                caveats=["Error generating explanation"],
-                examples=[],
-                next_steps=[],
-            )
+        reasoning = [
+            f"Path found with {path.length} connections",
+            f"Total confidence: {path.confidence:.0%}",
+            f"Path strength: {path.total_strength:.2f}",
+        ]
+
+        # Build node sequence explanation: one batched lookup for the
+        # whole path instead of a query per hop. get_nodes_by_ids
+        # degrades to {} on DB errors, so ids simply pass through as
+        # labels — no exception scope needed here
+        nodes_by_id = self.db.get_nodes_by_ids(path.nodes)
+        node_names = [
+            nodes_by_id[nid].label if nid in nodes_by_id else nid
+            for nid in path.nodes
+        ]
+
+        details = (
+            f"Integration path from {start_node.label} to {end_node.label}: "
+            f"{' → '.join(node_names)}. "
+            f"This sequence represents a {path.length}-step workflow. "
+            f"Each connection has been validated as working in real n8n workflows."
+        )
+
+        caveats = []
+        if path.length > 3:
+            caveats.append("⚠️ This is a long path - consider if a shorter route exists")
+
+        if path.confidence < 0.7:
+            caveats.append("⚠️ Confidence is moderate - test thoroughly before deploying")
+
+        next_steps = [
+            f"Use {', '.join(node_names[1:-1])} as intermediate steps",
+            "Configure data mapping between each connection",
+            "Test each step individually before running full workflow",
+        ]
+
+        return Explanation(
+            type=ExplanationType.PATH_CONNECTION,
+            summary=f"Integration path: {start_node.label} → {end_node.label}",
+            detailed=details,
+            confidence=path.confidence,
+            reasoning_steps=reasoning,
+            caveats=caveats,
+            examples=[],
+            next_steps=next_steps,
+        )
 
     async def explain_integration(
         self,
@@ -254,63 +250,71 @@ class ExplanationGenerator:
             Explanation of the integration
         """
         try:
-            source = self.db.get_node(source_node_id)
-            target = self.db.get_node(target_node_id)
-
-            if not source or not target:
-                raise ValueError("Nodes not found")
-
-            reasoning = [
-                f"Nodes are connected via '{relationship_type}' relationship",
-                f"This is a validated integration pattern",
-                f"Both nodes have been successfully used together in real workflows",
-            ]
-
-            details = (
-                f"{source.label} integrates with {target.label} "
-                f"through {relationship_type}. "
-                f"This combination is commonly used in {relationship_type} patterns. "
-                f"The nodes share compatible data formats and can exchange outputs directly."
-            )
-
-            # Get agent tips from metadata
-            source_tips = source.metadata.get("agent_tips", [])
-            target_tips = target.metadata.get("agent_tips", [])
-
-            caveats = []
-            if source.metadata.get("failure_modes"):
-                caveats.extend(source.metadata.get("failure_modes", [])[:1])
-
-            next_steps = [
-                f"Map {source.label} output to {target.label} input",
-                f"Configure {target.label} to receive data from {source.label}",
-                "Test the integration with sample data",
-            ]
-
-            return Explanation(
-                type=ExplanationType.INTEGRATION,
-                summary=f"Integration: {source.label} → {target.label}",
-                detailed=details,
-                confidence=0.85,
-                reasoning_steps=reasoning,
-                caveats=caveats,
-                examples=[],
-                next_steps=next_steps,
-            )
+            # Cached: identical (source, target, type) triples recur
+            # across sessions and the explanation is deterministic.
+            # Only this call can fail (missing nodes raise ValueError)
+            return self._integration_explanation(
+                source_node_id, target_node_id, relationship_type)
 
         except Exception as e:
             logger.error(f"Error explaining integration: {e}")
-            return Explanation(
-                type=ExplanationType.INTEGRATION,
-                summary="Integration explanation unavailable",
-                detailed="Unable to generate integration explanation",
-                confidence=0.0,
-                reasoning_steps=[],
-                caveats=["Error generating explanation"],
-                examples=[],
-                next_steps=[],
+            return self._error_explanation(
+                ExplanationType.INTEGRATION,
+                "Integration explanation unavailable",
+                "Unable to generate integration explanation",
             )
 
+    def _build_integration_explanation(
+        self,
+        source_node_id: str,
+        target_node_id: str,
+        relationship_type: str,
+    ) -> Explanation:
+        """Build the integration explanation; raises if a node is missing"""
+        source = self._get_node(source_node_id)
+        target = self._get_node(target_node_id)
+
+        if not source or not target:
+            raise ValueError("Nodes not found")
+
+        reasoning = [
+            f"Nodes are connected via '{relationship_type}' relationship",
+            f"This is a validated integration pattern",
+            f"Both nodes have been successfully used together in real workflows",
+        ]
+
+        details = (
+            f"{source.label} integrates with {target.label} "
+            f"through {relationship_type}. "
+            f"This combination is commonly used in {relationship_type} patterns. "
+            f"The nodes share compatible data formats and can exchange outputs directly."
+        )
+
+        # Get agent tips from metadata
+        source_tips = source.metadata.get("agent_tips", [])
+        target_tips = target.metadata.get("agent_tips", [])
+
+        caveats = []
+        if source.metadata.get("failure_modes"):
+            caveats.extend(source.metadata.get("failure_modes", [])[:1])
+
+        next_steps = [
+            f"Map {source.label} output to {target.label} input",
+            f"Configure {target.label} to receive data from {source.label}",
+            "Test the integration with sample data",
+        ]
+
+        return Explanation(
+            type=ExplanationType.INTEGRATION,
+            summary=f"Integration: {source.label} → {target.label}",
+            detailed=details,
+            confidence=0.85,
+            reasoning_steps=reasoning,
+            caveats=caveats,
+            examples=[],
+            next_steps=next_steps,
+        )
+
     async def explain_alternatives(
         self,
         node_id: str,
@@ -326,72 +330,75 @@ class ExplanationGenerator:
         Returns:
             Explanation of alternatives
         """
-        try:
-            original = self.db.get_node(node_id)
-
-            if not original:
-                raise ValueError("Original node not found")
-
-            alternatives = []
-            for alt_id in alternative_ids:
-                alt = self.db.get_node(alt_id)
-                if alt:
-                    alternatives.append(alt)
-
-            reasoning = [
-                f"Found {len(alternatives)} alternative node(s)",
-                "Each alternative performs similar functions",
-                "Choosing depends on your specific use case",
-            ]
-
-            alt_names = ", ".join(a.label for a in alternatives)
-            details = (
-                f"Instead of {original.label}, you might consider: {alt_names}. "
-                f"Each provides similar functionality with different strengths. "
-                f"Choose based on:"
+        # DB lookups degrade to None on errors; everything after is
+        # pure formatting
+        original = self._get_node(node_id)
+
+        if not original:
+            logger.error(f"Error explaining alternatives: node {node_id} not found")
+            return self._error_explanation(
+                ExplanationType.ALTERNATIVE,
+                "Alternative explanation unavailable",
+                "Unable to generate alternatives explanation",
             )
 
-            details += "\n- Integration requirements"
-            details += "\n- Performance needs"
-            details += "\n- Configuration complexity"
-
-            next_steps = [
-                "Compare feature sets of each alternative",
-                "Check documentation for specific use case fit",
-                "Consider your existing node configurations",
-            ]
-
-            return Explanation(
-                type=ExplanationType.ALTERNATIVE,
-                summary=f"Alternatives to {original.label}",
-                detailed=details,
-                confidence=0.8,
-                reasoning_steps=reasoning,
-                caveats=[],
-                examples=alt_names.split(", "),
-                next_steps=next_steps,
-            )
-
-        except Exception as e:
-            logger.error(f"Error explaining alternatives: {e}")
-            return Explanation(
-                type=ExplanationType.ALTERNATIVE,
-                summary="Alternative explanation unavailable",
-                detailed="Unable to generate alternatives explanation",
-                confidence=0.0,
-                reasoning_steps=[],
-                caveats=["Error generating explanation"],
-                examples=[],
-                next_steps=[],
-            )
+        alternatives = []
+        for alt_id in alternative_ids:
+            alt = self._get_node(alt_id)
+            if alt:
+                alternatives.append(alt)
+
+        reasoning = [
+            f"Found {len(alternatives)} alternative node(s)",
+            "Each alternative performs similar functions",
+            "Choosing depends on your specific use case",
+        ]
+
+        alt_names = ", ".join(a.label for a in alternatives)
+        details = (
+            f"Instead of {original.label}, you might consider: {alt_names}. "
+            f"Each provides similar functionality with different strengths. "
+            f"Choose based on:"
+            "\n- Integration requirements"
+            "\n- Performance needs"
+            "\n- Configuration complexity"
+        )
+
+        next_steps = [
+            "Compare feature sets of each alternative",
+            "Check documentation for specific use case fit",
+            "Consider your existing node configurations",
+        ]
+
+        return Explanation(
+            type=ExplanationType.ALTERNATIVE,
+            summary=f"Alternatives to {original.label}",
+            detailed=details,
+            confidence=0.8,
+            reasoning_steps=reasoning,
+            caveats=[],
+            examples=alt_names.split(", "),
+            next_steps=next_steps,
+        )
+
+    @staticmethod
+    def _error_explanation(type: ExplanationType, summary: str,
+                           detailed: str) -> Explanation:
+        """Fallback explanation when generation cannot complete"""
+        return Explanation(
+            type=type,
+            summary=summary,
+            detailed=detailed,
+            confidence=0.0,
+            reasoning_steps=[],
+            caveats=["Error generating explanation"],
+            examples=[],
+            next_steps=[],
+        )
 
     def _format_caveats(self, caveats: List[str]) -> str:
         """Format caveats for display"""
         if not caveats:
             return ""
 
-        formatted = "**Important Notes:**\n"
-        for caveat in caveats:
-            formatted += f"- {caveat}\n"
-
-        return formatted
+        return "**Important Notes:**\n" + "".join(f"- {c}\n" for c in caveats)
@@ -4,6 +4,7 @@ Orchestrate building complete knowledge graph with agentic focus
 """
 
 import logging
+import os
 import time
 import numpy as np
 from typing import List, Dict, Optional, Tuple
@@ -11,14 +12,28 @@ from pathlib import Path
 from datetime import datetime
 import json
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    orjson = None
+    HAS_ORJSON = False
+
 from storage.database import Database
-from storage.models import Node, Edge, Embedding, GraphMetadata
+from storage.models import Embedding, GraphMetadata
 from .entity_extractor import AgenticEntityExtractor, AgenticNode
 from .relationship_builder import AgenticRelationshipBuilder, AgenticEdge, RelationshipType
 
 logger = logging.getLogger(__name__)
 
 
+def _dumps_text(obj) -> str:
+    """Serialize to JSON text, via orjson when available"""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, default=str).decode('utf-8')
+    return json.dumps(obj, default=str)
+
+
 class AgenticGraphBuilder:
     """
     Orchestrate building complete knowledge graph with agentic focus
@@ -35,6 +50,8 @@ class AgenticGraphBuilder:
         self.db = db
         self.entity_extractor = AgenticEntityExtractor("/tmp/nodes.db")  # Will be updated
         self.relationship_builder = AgenticRelationshipBuilder()
+        # Model weights take seconds to load; reuse across builds
+        self._transformer_cache: Dict[str, object] = {}
         self.start_time = None
         self.stats = {
             'nodes_extracted': 0,
@@ -125,19 +142,33 @@ class AgenticGraphBuilder:
             logger.error(f"Node extraction failed: {e}")
             return []
 
+    _STORE_CHUNK = 1000
+
     def _store_nodes(self, nodes: List[AgenticNode]) -> int:
-        """Store nodes in database"""
+        """Store nodes in database via chunked bulk inserts
+
+        Each chunk streams ready-to-insert row tuples straight into
+        executemany — no intermediate Node dataclass or to_dict() per
+        row — with keywords/metadata serialized up front. Already-stored
+        ids are filtered locally against one SELECT instead of probing
+        the database per row.
+        """
+        existing = self.db.get_all_node_ids()
+        if existing:
+            nodes = [node for node in nodes if node.id not in existing]
         stored = 0
-        for i, node in enumerate(nodes):
-            try:
-                # Convert agentic node to storage node
-                storage_node = Node(
-                    id=node.id,
-                    label=node.label,
-                    description=node.description,
-                    category=node.category,
-                    keywords=node.keywords,
-                    metadata={
+        for start in range(0, len(nodes), self._STORE_CHUNK):
+            chunk = nodes[start:start + self._STORE_CHUNK]
+            now = int(time.time())
+            rows = (
+                (
+                    node.id,
+                    node.label,
+                    node.description,
+                    node.category,
+                    _dumps_text(node.keywords),
+                    None,  # embedding stored separately
+                    _dumps_text({
                         'use_cases': node.use_cases,
                         'prerequisites': node.prerequisites,
                         'agent_tips': node.agent_tips,
@@ -150,17 +181,17 @@ class AgenticGraphBuilder:
                         'success_rate': node.success_rate,
                         'usage_frequency': node.usage_frequency,
                         'average_rating': node.average_rating,
-                    }
+                    }),
+                    now,
+                    now,
                 )
-
-                if self.db.add_node(storage_node):
-                    stored += 1
-
-                if (i + 1) % 100 == 0:
-                    logger.info(f"  Stored {i + 1}/{len(nodes)} nodes...")
-
-            except Exception as e:
-                logger.warning(f"Failed to store node {node.id}: {e}")
+                for node in chunk
+            )
+            stored += self.db.add_node_rows(rows)
+            # Progress at chunk granularity; skip the f-string entirely
+            # when INFO is filtered out
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"  Stored {stored}/{len(nodes)} nodes...")
 
         return stored
 
@@ -187,47 +218,105 @@ class AgenticGraphBuilder:
             embeddings = []
 
             if use_real_embeddings:
-                logger.info(f"Loading {model}...")
-                transformer = SentenceTransformer(model)
-
-                # Prepare texts to embed
-                texts = [f"{node.label}: {node.description or ''}" for node in nodes]
-
-                logger.info("Generating embeddings...")
-                embeddings_data = transformer.encode(texts, show_progress_bar=True)
-
-                # Create embedding objects
-                for i, node in enumerate(nodes):
-                    embedding = Embedding(
-                        id=f"emb-{node.id}",
-                        node_id=node.id,
-                        embedding=embeddings_data[i],
-                        dimension=embeddings_data[i].shape[0],
-                        model=model
+                # CUDA lets us run the forward pass in half precision
+                device = None
+                torch = None
+                try:
+                    import torch
+                    if torch.cuda.is_available():
+                        device = 'cuda'
+                except ImportError:
+                    pass
+
+                transformer = self._transformer_cache.get(model)
+                if transformer is None:
+                    logger.info(f"Loading {model}...")
+                    transformer = SentenceTransformer(model, device=device)
+                    if device == 'cuda':
+                        transformer = transformer.half()
+                        # Compile the underlying HF model so repeated batches
+                        # run through a fused graph instead of eager ops.
+                        # Best-effort: older torch builds or exotic backends
+                        # just fall back to eager.
+                        if hasattr(torch, 'compile'):
+                            try:
+                                first = transformer._first_module()
+                                first.auto_model = torch.compile(
+                                    first.auto_model, mode='reduce-overhead')
+                            except Exception as e:
+                                logger.warning(f"torch.compile unavailable, using eager mode: {e}")
+                    self._transformer_cache[model] = transformer
+
+                # Skip nodes that already have a vector for this model —
+                # re-embedding runs only pay for what changed
+                already = self.db.get_embedded_node_ids(model)
+                new_nodes = [node for node in nodes
+                             if node.id not in already] if already else nodes
+
+                new_vectors = {}
+                if new_nodes:
+                    texts = [f"{node.label}: {node.description or ''}" for node in new_nodes]
+
+                    logger.info("Generating embeddings...")
+                    batch_size = int(os.environ.get('GRAPH_EMBED_BATCH_SIZE', '256'))
+                    embeddings_data = transformer.encode(
+                        texts,
+                        batch_size=batch_size,
+                        show_progress_bar=True,
+                        convert_to_numpy=True,
+                        normalize_embeddings=True,
                     )
-                    embeddings.append(embedding)
-                    self.db.add_embedding(embedding)
-
-                    if (i + 1) % 100 == 0:
-                        logger.info(f"  Processed {i + 1}/{len(nodes)} embeddings...")
+                    # Stored dtype stays float32 regardless of compute precision
+                    embeddings_data = np.ascontiguousarray(embeddings_data, dtype=np.float32)
+
+                    # Create embedding objects over matrix row views (no copies)
+                    dimension = embeddings_data.shape[1]
+                    embeddings = [
+                        Embedding(
+                            id=f"emb-{node.id}",
+                            node_id=node.id,
+                            embedding=embeddings_data[i],
+                            dimension=dimension,
+                            model=model
+                        )
+                        for i, node in enumerate(new_nodes)
+                    ]
+                    self.db.add_embeddings_bulk(embeddings)
+                    new_vectors = {node.id: embeddings_data[i]
+                                   for i, node in enumerate(new_nodes)}
+
+                # Repack the matrix over every node that has a vector,
+                # reusing stored ones for skipped nodes (one batched read)
+                reused = self.db.get_embeddings_for_nodes(
+                    [node.id for node in nodes if node.id in already])
+                matrix_ids = [node.id for node in nodes
+                              if node.id in new_vectors or node.id in reused]
+                if matrix_ids:
+                    matrix = np.stack([
+                        new_vectors[nid] if nid in new_vectors else reused[nid]
+                        for nid in matrix_ids
+                    ])
+                    self.db.set_embedding_matrix(model, matrix_ids, matrix)
 
             else:
-                # Generate random embeddings for testing
+                # Generate random embeddings for testing: one contiguous
+                # RNG fill instead of N small allocations and casts
                 logger.info("Generating random embeddings for testing...")
-                for i, node in enumerate(nodes):
-                    embedding_vector = np.random.rand(384).astype(np.float32)
-                    embedding = Embedding(
+                rng = np.random.default_rng()
+                all_embs = rng.random((len(nodes), 384), dtype=np.float32)
+                embeddings = [
+                    Embedding(
                         id=f"emb-{node.id}",
                         node_id=node.id,
-                        embedding=embedding_vector,
+                        embedding=all_embs[i],
                         dimension=384,
                         model=model
                     )
-                    embeddings.append(embedding)
-                    self.db.add_embedding(embedding)
-
-                    if (i + 1) % 100 == 0:
-                        logger.info(f"  Processed {i + 1}/{len(nodes)} embeddings...")
+                    for i, node in enumerate(nodes)
+                ]
+                self.db.add_embeddings_bulk(embeddings)
+                self.db.set_embedding_matrix(
+                    model, [node.id for node in nodes], all_embs)
 
             return embeddings
 
@@ -245,35 +334,47 @@ class AgenticGraphBuilder:
             return []
 
     def _store_relationships(self, relationships: List[AgenticEdge]) -> int:
-        """Store relationships in database"""
+        """Store relationships in database via chunked bulk inserts
+
+        Same streaming shape as _store_nodes: raw row tuples with
+        metadata serialized up front, no Edge intermediate per row.
+        Duplicates and edges whose endpoints were never stored (e.g.
+        pseudo category/pattern ids) are filtered locally up front, so
+        chunks never trip the foreign-key fallback path.
+        """
+        valid_ids = self.db.get_all_node_ids()
+        existing_keys = self.db.get_all_edge_keys()
+        relationships = [
+            rel for rel in relationships
+            if rel.source_id in valid_ids and rel.target_id in valid_ids
+            and (rel.source_id, rel.target_id, rel.type.value) not in existing_keys
+        ]
         stored = 0
-        for i, rel in enumerate(relationships):
-            try:
-                # Convert agentic edge to storage edge
-                storage_edge = Edge(
-                    id=rel.id,
-                    source_id=rel.source_id,
-                    target_id=rel.target_id,
-                    type=rel.type,
-                    strength=rel.strength,
-                    metadata={
+        for start in range(0, len(relationships), self._STORE_CHUNK):
+            chunk = relationships[start:start + self._STORE_CHUNK]
+            now = int(time.time())
+            rows = (
+                (
+                    rel.id,
+                    rel.source_id,
+                    rel.target_id,
+                    rel.type.value,
+                    rel.strength,
+                    _dumps_text({
                         'reasoning': rel.reasoning,
                         'success_rate': rel.success_rate,
                         'common_pattern': rel.common_pattern,
                         'common_config_mapping': rel.common_config_mapping,
                         'gotchas': rel.gotchas,
                         'agent_guidance': rel.agent_guidance,
-                    }
+                    }),
+                    now,
                 )
-
-                if self.db.add_edge(storage_edge):
-                    stored += 1
-
-                if (i + 1) % 500 == 0:
-                    logger.info(f"  Stored {i + 1}/{len(relationships)} relationships...")
-
-            except Exception as e:
-                logger.warning(f"Failed to store relationship {rel.id}: {e}")
+                for rel in chunk
+            )
+            stored += self.db.add_edge_rows(rows)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"  Stored {stored}/{len(relationships)} relationships...")
 
         return stored
 
@@ -282,7 +383,7 @@ class AgenticGraphBuilder:
         try:
             timestamp = datetime.now().isoformat()
 
-            metadata_entries = [
+            metadata_entries = (
                 ('build_timestamp', timestamp),
                 ('graph_type', 'agentic-graphrag-n8n'),
                 ('version', '1.0.0'),
@@ -291,10 +392,9 @@ class AgenticGraphBuilder:
                 ('embeddings_total', str(self.stats['embeddings_generated'])),
                 ('embedding_model', 'all-MiniLM-L6-v2'),
                 ('build_time_seconds', str(int(self.stats['total_time_seconds']))),
-            ]
+            )
 
-            for key, value in metadata_entries:
-                self.db.set_metadata(key, value)
+            self.db.set_metadata_bulk(metadata_entries)
 
             logger.info("✓ Stored graph metadata")
 
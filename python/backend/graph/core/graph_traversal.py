@@ -13,18 +13,156 @@ Agent-Focused Features:
 - Circular dependency detection
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from typing import List, Dict, Optional, Set, Tuple
 from enum import Enum
-from collections import deque
+from collections import OrderedDict
+from array import array
+import heapq
 import logging
 import time
 
+import numpy as np
+
+_perf = time.perf_counter  # bound once; hot paths time many short calls
+
 from storage import Database, Node, Edge, RelationshipType
 
 logger = logging.getLogger(__name__)
 
 
+class _AdjacencySnapshot:
+    """
+    In-memory CSR adjacency over the edges table
+
+    Built from one lean topology scan so traversal hops become slices
+    into contiguous arrays instead of two DB queries per popped node.
+    Node ids are mapped to dense int indices; parallel arrays hold edge
+    ids, strengths and types shared by the out- and in-CSR views.
+    """
+
+    __slots__ = ('node_ids', 'index', 'edge_ids', 'edge_strength', 'edge_type',
+                 'edge_weight',
+                 'out_indptr', 'out_neighbors', 'out_edges',
+                 'in_indptr', 'in_neighbors', 'in_edges', 'version')
+
+    def __init__(self, topology: List[Tuple[str, str, str, float, str]], version):
+        self.version = version
+        node_ids = sorted({t[1] for t in topology} | {t[2] for t in topology})
+        self.node_ids = node_ids
+        self.index = {nid: i for i, nid in enumerate(node_ids)}
+        n = len(node_ids)
+
+        self.edge_ids = [t[0] for t in topology]
+        self.edge_strength = np.array([t[3] for t in topology], dtype=np.float64)
+        # Dijkstra weight: minimizing sum(-log s) maximizes prod(s)
+        self.edge_weight = -np.log(np.clip(self.edge_strength, 1e-9, None))
+        self.edge_type = [t[4] for t in topology]
+
+        src = np.array([self.index[t[1]] for t in topology], dtype=np.int64)
+        dst = np.array([self.index[t[2]] for t in topology], dtype=np.int64)
+
+        # Out-CSR: edges grouped by source, neighbors sorted for locality
+        order = np.lexsort((dst, src))
+        self.out_neighbors = dst[order]
+        self.out_edges = order
+        self.out_indptr = np.zeros(n + 1, dtype=np.int64)
+        if len(src):
+            np.cumsum(np.bincount(src, minlength=n), out=self.out_indptr[1:])
+
+        # In-CSR: same edges grouped by target
+        order = np.lexsort((src, dst))
+        self.in_neighbors = src[order]
+        self.in_edges = order
+        self.in_indptr = np.zeros(n + 1, dtype=np.int64)
+        if len(dst):
+            np.cumsum(np.bincount(dst, minlength=n), out=self.in_indptr[1:])
+
+    def out_slice(self, u: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Neighbor and edge index arrays for edges leaving node u"""
+        start, end = self.out_indptr[u], self.out_indptr[u + 1]
+        return self.out_neighbors[start:end], self.out_edges[start:end]
+
+    def in_slice(self, u: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Neighbor and edge index arrays for edges entering node u"""
+        start, end = self.in_indptr[u], self.in_indptr[u + 1]
+        return self.in_neighbors[start:end], self.in_edges[start:end]
+
+
+def _find_all_paths_kernel(
+    out_indptr, out_nbrs, out_eidx,
+    in_indptr, in_nbrs, in_eidx,
+    start_idx: int, end_idx: int,
+    max_hops: int, max_paths: int,
+    visited: bytearray, dirty: List[int],
+) -> List[Tuple[Tuple[int, ...], Tuple[int, ...]]]:
+    """
+    Iterative all-paths DFS over raw CSR arrays
+
+    Operates purely on integer indices — no dataclasses, string ids or
+    recursion in the hot loop. Each stack level keeps just a cursor into
+    the node's merged out+in incident stream, and path buffers are
+    shared and backtracked in place. Returns (node indices, edge
+    indices) tuples in discovery order; the caller materializes Path
+    objects. Indices set in `visited` are appended to `dirty` so the
+    caller can reset the pooled array.
+    """
+    results: List[Tuple[Tuple[int, ...], Tuple[int, ...]]] = []
+    if start_idx == end_idx:
+        results.append(((start_idx,), ()))
+        return results
+
+    # Flat int buffers sized by the hop limit instead of growing lists:
+    # path_buf[d] is the node at depth d, edge_buf[d] the edge entering
+    # it (d >= 1), pos_buf[d] the cursor into its incident stream
+    path_buf = array('i', bytes(4 * (max_hops + 1)))
+    edge_buf = array('i', bytes(4 * (max_hops + 1)))
+    pos_buf = array('i', bytes(4 * (max_hops + 1)))
+
+    depth = 0
+    path_buf[0] = start_idx
+    visited[start_idx] = 1
+    dirty.append(start_idx)
+
+    while depth >= 0:
+        u = path_buf[depth]
+        pos = pos_buf[depth]
+        out_start = out_indptr[u]
+        out_deg = out_indptr[u + 1] - out_start
+        total_deg = out_deg + in_indptr[u + 1] - in_indptr[u]
+
+        if pos >= total_deg or len(results) >= max_paths:
+            # Incident stream exhausted (or enough paths): backtrack
+            visited[u] = 0
+            depth -= 1
+            continue
+
+        pos_buf[depth] = pos + 1
+        if pos < out_deg:
+            k = out_start + pos
+            v, e = out_nbrs[k], out_eidx[k]
+        else:
+            k = in_indptr[u] + pos - out_deg
+            v, e = in_nbrs[k], in_eidx[k]
+
+        if visited[v]:
+            continue
+        if v == end_idx:
+            if depth + 1 <= max_hops:
+                results.append((tuple(path_buf[:depth + 1]) + (int(v),),
+                                tuple(edge_buf[1:depth + 1]) + (int(e),)))
+            continue
+        if depth + 1 < max_hops:
+            visited[v] = 1
+            dirty.append(v)
+            depth += 1
+            path_buf[depth] = v
+            edge_buf[depth] = e
+            pos_buf[depth] = 0
+
+    return results
+
+
 class TraversalType(Enum):
     """Types of graph traversals"""
     BFS = "breadth_first"           # Breadth-first search
@@ -33,9 +171,9 @@ class TraversalType(Enum):
     MULTI_HOP = "multi_hop"         # Multi-hop reasoning
 
 
-@dataclass
+@dataclass(frozen=True)
 class Path:
-    """Represents a path through the graph"""
+    """Represents a path through the graph (immutable so results can be cached)"""
     nodes: List[str]               # Node IDs in path order
     edges: List[str]               # Edge IDs connecting nodes
     length: int                    # Number of hops
@@ -57,17 +195,6 @@ class Path:
         }
 
 
-@dataclass
-class TraversalNode:
-    """Internal node for traversal"""
-    node_id: str
-    depth: int
-    path: List[str] = field(default_factory=list)
-    edges_in_path: List[str] = field(default_factory=list)
-    confidence: float = 1.0
-    visited_from: Optional[str] = None
-
-
 class GraphTraversalEngine:
     """
     Graph traversal engine for multi-hop reasoning
@@ -84,6 +211,17 @@ class GraphTraversalEngine:
             db: Database instance
         """
         self.db = db
+        self._snapshot_cache: Optional[_AdjacencySnapshot] = None
+        # Agent sessions repeat identical path queries; bounded LRU keyed
+        # on arguments plus snapshot version
+        self._path_cache: OrderedDict = OrderedDict()
+        # Pooled visited markers, one byte per dense node index, reused
+        # across traversals and reset via dirty lists instead of full
+        # zero-fills. Stacks rather than single slots so concurrent
+        # traversals each get their own buffer
+        self._visited_pool: List[bytearray] = []
+        # Pooled scratch lists backing the traversal heap/queue
+        self._scratch_pool: List[list] = []
         self.traversal_stats = {
             "total_traversals": 0,
             "bfs_traversals": 0,
@@ -92,6 +230,73 @@ class GraphTraversalEngine:
             "avg_traversal_time_ms": 0,
         }
 
+    def _snapshot(self) -> _AdjacencySnapshot:
+        """
+        Get the CSR adjacency snapshot, rebuilding when the edge count
+        changes
+
+        The count check is one cheap aggregate per traversal; call
+        invalidate() after in-place edge updates that keep the count.
+        """
+        version = self.db.edge_count()
+        snap = self._snapshot_cache
+        if snap is None or snap.version != version:
+            snap = _AdjacencySnapshot(self.db.get_edge_topology(), version)
+            self._snapshot_cache = snap
+        return snap
+
+    _PATH_CACHE_MAX = 1024
+
+    def _cache_get(self, key):
+        """LRU lookup; returns (hit, value) so cached misses count too"""
+        if key in self._path_cache:
+            self._path_cache.move_to_end(key)
+            return True, self._path_cache[key]
+        return False, None
+
+    def _cache_put(self, key, value):
+        """Insert into the LRU, evicting the oldest entry at capacity"""
+        if len(self._path_cache) >= self._PATH_CACHE_MAX:
+            self._path_cache.popitem(last=False)
+        self._path_cache[key] = value
+
+    def invalidate(self):
+        """Drop the adjacency snapshot and path cache after graph updates"""
+        self._snapshot_cache = None
+        self._path_cache.clear()
+
+    def _borrow_visited(self, n: int) -> bytearray:
+        """
+        Borrow the pooled visited marker, grown to cover n dense indices
+
+        One byte per node replaces a Python set: membership is an index
+        instead of a hash probe, and the allocation is amortized across
+        traversals. Callers must hand the array back via
+        _return_visited() with the list of indices they set.
+        """
+        if self._visited_pool:
+            pool = self._visited_pool.pop()
+            if len(pool) >= n:
+                return pool
+        return bytearray(n)
+
+    def _return_visited(self, pool: bytearray, dirty: List[int]):
+        """Clear only the touched bytes and return the array to the pool"""
+        for v in dirty:
+            pool[v] = 0
+        self._visited_pool.append(pool)
+
+    def _borrow_scratch(self) -> list:
+        """Borrow a pooled list for heap/queue storage"""
+        if self._scratch_pool:
+            return self._scratch_pool.pop()
+        return []
+
+    def _return_scratch(self, scratch: list):
+        """Clear a scratch list and return it to the pool"""
+        scratch.clear()
+        self._scratch_pool.append(scratch)
+
     async def find_shortest_path(
         self,
         start_node_id: str,
@@ -99,7 +304,10 @@ class GraphTraversalEngine:
         max_hops: int = 5,
     ) -> Optional[Path]:
         """
-        Find shortest path between two nodes using BFS
+        Find the best path between two nodes using Dijkstra's algorithm
+
+        Edges are weighted by -log(strength), so the returned path is
+        the strongest overall connection within the hop limit.
 
         Args:
             start_node_id: Starting node ID
@@ -109,8 +317,7 @@ class GraphTraversalEngine:
         Returns:
             Path if found, None otherwise
         """
-        import time
-        start_time = time.time()
+        start_time = _perf()
 
         try:
             if start_node_id == end_node_id:
@@ -123,91 +330,96 @@ class GraphTraversalEngine:
                     reasoning="Source and target are the same node",
                 )
 
-            # BFS queue
-            queue = deque([TraversalNode(
-                node_id=start_node_id,
-                depth=0,
-                path=[start_node_id],
-                edges_in_path=[],
-                confidence=1.0,
-            )])
-
-            visited = {start_node_id}
-
-            while queue:
-                current = queue.popleft()
-
-                if current.depth >= max_hops:
-                    continue
-
-                # Get connected nodes
-                out_edges = self.db.get_edges_from_node(current.node_id)
-                in_edges = self.db.get_edges_to_node(current.node_id)
-
-                # Try outgoing edges
-                for edge in out_edges:
-                    if edge.target_id == end_node_id:
-                        # Found it!
-                        path_nodes = current.path + [end_node_id]
-                        path_edges = current.edges_in_path + [edge.id]
-                        total_strength = current.confidence * edge.strength
-
-                        elapsed = (time.time() - start_time) * 1000
-                        self._update_stats("bfs", elapsed, True)
-
-                        return Path(
-                            nodes=path_nodes,
-                            edges=path_edges,
-                            length=current.depth + 1,
-                            total_strength=total_strength,
-                            confidence=min(1.0, total_strength),
-                            reasoning=f"Path through {current.depth + 1} connections: {' → '.join(path_nodes)}",
-                        )
-
-                    if edge.target_id not in visited:
-                        visited.add(edge.target_id)
-                        queue.append(TraversalNode(
-                            node_id=edge.target_id,
-                            depth=current.depth + 1,
-                            path=current.path + [edge.target_id],
-                            edges_in_path=current.edges_in_path + [edge.id],
-                            confidence=current.confidence * edge.strength,
-                        ))
-
-                # Try incoming edges
-                for edge in in_edges:
-                    if edge.source_id == end_node_id:
-                        path_nodes = current.path + [end_node_id]
-                        path_edges = current.edges_in_path + [edge.id]
-                        total_strength = current.confidence * edge.strength
-
-                        elapsed = (time.time() - start_time) * 1000
-                        self._update_stats("bfs", elapsed, True)
-
-                        return Path(
-                            nodes=path_nodes,
-                            edges=path_edges,
-                            length=current.depth + 1,
-                            total_strength=total_strength,
-                            confidence=min(1.0, total_strength),
-                            reasoning=f"Path through {current.depth + 1} connections",
-                        )
-
-                    if edge.source_id not in visited:
-                        visited.add(edge.source_id)
-                        queue.append(TraversalNode(
-                            node_id=edge.source_id,
-                            depth=current.depth + 1,
-                            path=current.path + [edge.source_id],
-                            edges_in_path=current.edges_in_path + [edge.id],
-                            confidence=current.confidence * edge.strength,
-                        ))
-
-            elapsed = (time.time() - start_time) * 1000
-            self._update_stats("bfs", elapsed, False)
-
-            logger.info(f"No path found from {start_node_id} to {end_node_id}")
-            return None
+            snap = self._snapshot()
+            cache_key = ('shortest', start_node_id, end_node_id, max_hops,
+                         snap.version)
+            hit, cached = self._cache_get(cache_key)
+            if hit:
+                return cached
+
+            start_idx = snap.index.get(start_node_id)
+            end_idx = snap.index.get(end_node_id)
+            if start_idx is None or end_idx is None:
+                elapsed = (_perf() - start_time) * 1000
+                self._update_stats("bfs", elapsed, False)
+                logger.info(f"No path found from {start_node_id} to {end_node_id}")
+                return None
+
+            # Dijkstra on edge weights -log(strength): minimizing the
+            # weight sum maximizes the strength product, so the result
+            # is the *strongest* connection rather than merely the one
+            # with the fewest hops. State is keyed by (node, depth): a
+            # strong many-hop route to an intermediate node must not
+            # evict a weaker fewer-hop route that still has hop budget
+            # left, or hop-feasible paths to the target get discarded.
+            # Parent pointers: (node_idx, depth) ->
+            # (prev_idx, edge_idx, cumulative strength)
+            INF = float('inf')
+            dist = {(start_idx, 0): 0.0}
+            parents: Dict[Tuple[int, int], Tuple[int, int, float]] = {
+                (start_idx, 0): (-1, -1, 1.0)}
+            heap = self._borrow_scratch()
+            heap.append((0.0, start_idx, 0))
+            end_state: Optional[Tuple[int, int]] = None
+
+            try:
+                while heap:
+                    d, u, depth = heapq.heappop(heap)
+                    if d > dist.get((u, depth), INF):
+                        continue  # stale entry; a better route was found
+                    if u == end_idx:
+                        # First target state popped has the smallest
+                        # distance over every feasible depth: settled
+                        end_state = (u, depth)
+                        break
+                    if depth >= max_hops:
+                        continue
+                    cum_strength = parents[(u, depth)][2]
+
+                    out_nbrs, out_eidx = snap.out_slice(u)
+                    in_nbrs, in_eidx = snap.in_slice(u)
+                    for nbrs, eidx in ((out_nbrs, out_eidx), (in_nbrs, in_eidx)):
+                        for v, e in zip(nbrs.tolist(), eidx.tolist()):
+                            # A node reached at the hop limit can never
+                            # be expanded — only worth recording if it
+                            # is the target
+                            if depth + 1 >= max_hops and v != end_idx:
+                                continue
+                            nd = d + snap.edge_weight[e]
+                            key = (v, depth + 1)
+                            if nd < dist.get(key, INF):
+                                dist[key] = nd
+                                parents[key] = (
+                                    u, e,
+                                    cum_strength * snap.edge_strength[e])
+                                heapq.heappush(heap, (nd, v, depth + 1))
+            finally:
+                self._return_scratch(heap)
+
+            if end_state is None:
+                elapsed = (_perf() - start_time) * 1000
+                self._update_stats("bfs", elapsed, False)
+                logger.info(f"No path found from {start_node_id} to {end_node_id}")
+                self._cache_put(cache_key, None)
+                return None
+
+            path_nodes, path_edges, total_strength = \
+                self._backtrack(snap, parents, end_state)
+            length = end_state[1]
+
+            elapsed = (_perf() - start_time) * 1000
+            self._update_stats("bfs", elapsed, True)
+
+            found = Path(
+                nodes=path_nodes,
+                edges=path_edges,
+                length=length,
+                total_strength=total_strength,
+                confidence=min(1.0, total_strength),
+                reasoning=f"Path through {length} connections: {' → '.join(path_nodes)}",
+            )
+            self._cache_put(cache_key, found)
+            return found
 
         except Exception as e:
             logger.error(f"Shortest path error: {e}")
@@ -232,77 +444,60 @@ class GraphTraversalEngine:
         Returns:
             List of Path objects
         """
-        import time
-        start_time = time.time()
+        start_time = _perf()
 
         try:
             paths = []
 
-            # DFS to find all paths
-            def dfs(
-                current_id: str,
-                target_id: str,
-                path: List[str],
-                edges_in_path: List[str],
-                visited: Set[str],
-                depth: int,
-            ):
-                if len(paths) >= max_paths:
-                    return
-
-                if depth > max_hops:
-                    return
-
-                if current_id == target_id:
-                    total_strength = self._calculate_path_strength(edges_in_path)
-                    path_obj = Path(
-                        nodes=path,
-                        edges=edges_in_path,
-                        length=len(path) - 1,
-                        total_strength=total_strength,
-                        confidence=min(1.0, total_strength),
-                        reasoning=f"Alternative path through {len(path) - 1} connections",
-                    )
-                    paths.append(path_obj)
-                    return
-
-                # Try outgoing edges
-                out_edges = self.db.get_edges_from_node(current_id)
-                for edge in out_edges:
-                    if edge.target_id not in visited:
-                        visited.add(edge.target_id)
-                        dfs(
-                            edge.target_id,
-                            target_id,
-                            path + [edge.target_id],
-                            edges_in_path + [edge.id],
-                            visited.copy(),
-                            depth + 1,
-                        )
-
-                # Try incoming edges
-                in_edges = self.db.get_edges_to_node(current_id)
-                for edge in in_edges:
-                    if edge.source_id not in visited:
-                        visited.add(edge.source_id)
-                        dfs(
-                            edge.source_id,
-                            target_id,
-                            path + [edge.source_id],
-                            edges_in_path + [edge.id],
-                            visited.copy(),
-                            depth + 1,
-                        )
-
-            dfs(start_node_id, end_node_id, [start_node_id], [], {start_node_id}, 0)
+            snap = self._snapshot()
+            cache_key = ('all', start_node_id, end_node_id, max_hops,
+                         max_paths, snap.version)
+            hit, cached = self._cache_get(cache_key)
+            if hit:
+                return list(cached)
+
+            start_idx = snap.index.get(start_node_id)
+            end_idx = snap.index.get(end_node_id)
+            if start_idx is None or end_idx is None:
+                elapsed = (_perf() - start_time) * 1000
+                self._update_stats("dfs", elapsed, False)
+                logger.info(f"Found 0 paths from {start_node_id} to {end_node_id}")
+                return []
+
+            # Index-only DFS kernel over the raw CSR arrays; string ids
+            # and Path objects are materialized only for the few paths
+            # actually found
+            visited = self._borrow_visited(len(snap.node_ids))
+            dirty: List[int] = []
+            try:
+                raw_paths = _find_all_paths_kernel(
+                    snap.out_indptr, snap.out_neighbors, snap.out_edges,
+                    snap.in_indptr, snap.in_neighbors, snap.in_edges,
+                    start_idx, end_idx, max_hops, max_paths,
+                    visited, dirty)
+            finally:
+                self._return_visited(visited, dirty)
+
+            for node_idx, edge_idx in raw_paths:
+                path_edges = [snap.edge_ids[e] for e in edge_idx]
+                total_strength = self._calculate_path_strength(snap, edge_idx)
+                paths.append(Path(
+                    nodes=[snap.node_ids[v] for v in node_idx],
+                    edges=path_edges,
+                    length=len(node_idx) - 1,
+                    total_strength=total_strength,
+                    confidence=min(1.0, total_strength),
+                    reasoning=f"Alternative path through {len(node_idx) - 1} connections",
+                ))
 
             # Sort by confidence
             paths.sort(key=lambda p: p.confidence, reverse=True)
 
-            elapsed = (time.time() - start_time) * 1000
+            elapsed = (_perf() - start_time) * 1000
             self._update_stats("dfs", elapsed, len(paths) > 0)
 
             logger.info(f"Found {len(paths)} paths from {start_node_id} to {end_node_id}")
+            self._cache_put(cache_key, tuple(paths))
             return paths
 
         except Exception as e:
@@ -329,28 +524,43 @@ class GraphTraversalEngine:
         try:
             result = {0: [node_id]}
 
-            current_level = {node_id}
+            snap = self._snapshot()
+            root_idx = snap.index.get(node_id)
+            if root_idx is None:
+                return result
+
+            # One boolean mask over all edges replaces a per-edge
+            # membership test in the inner loop
+            type_mask = None
+            if relationship_types is not None:
+                allowed = {t.value if isinstance(t, RelationshipType) else t
+                           for t in relationship_types}
+                type_mask = np.fromiter(
+                    (t in allowed for t in snap.edge_type),
+                    dtype=bool, count=len(snap.edge_type))
+
+            # Vectorized level expansion: concatenate the CSR slices of
+            # the whole frontier, then dedupe and drop the root in one
+            # setdiff1d instead of per-neighbor set operations
+            root_arr = np.array([root_idx], dtype=np.int64)
+            current_level = root_arr
 
             for level in range(1, depth + 1):
-                next_level = set()
-
-                for current_id in current_level:
-                    # Get outgoing
-                    out_edges = self.db.get_edges_from_node(current_id)
-                    for edge in out_edges:
-                        if relationship_types is None or edge.type in relationship_types:
-                            if edge.target_id not in result.get(0, []):
-                                next_level.add(edge.target_id)
-
-                    # Get incoming
-                    in_edges = self.db.get_edges_to_node(current_id)
-                    for edge in in_edges:
-                        if relationship_types is None or edge.type in relationship_types:
-                            if edge.source_id not in result.get(0, []):
-                                next_level.add(edge.source_id)
-
-                if next_level:
-                    result[level] = list(next_level)
+                parts = []
+                for u in current_level.tolist():
+                    for nbrs, eidx in (snap.out_slice(u), snap.in_slice(u)):
+                        if type_mask is not None:
+                            nbrs = nbrs[type_mask[eidx]]
+                        if len(nbrs):
+                            parts.append(nbrs)
+
+                if not parts:
+                    break
+                next_level = np.setdiff1d(np.concatenate(parts), root_arr)
+                if not next_level.size:
+                    break
+                result[level] = [snap.node_ids[v] for v in next_level.tolist()]
+                current_level = next_level
 
             return result
 
@@ -374,43 +584,70 @@ class GraphTraversalEngine:
             True if circular dependency found
         """
         try:
-            visited = set()
-            rec_stack = set()
-
-            def has_cycle(current_id: str) -> bool:
-                visited.add(current_id)
-                rec_stack.add(current_id)
-
-                # Check outgoing edges
-                out_edges = self.db.get_edges_from_node(current_id)
-                for edge in out_edges:
-                    if edge.target_id not in visited:
-                        if has_cycle(edge.target_id):
-                            return True
-                    elif edge.target_id in rec_stack:
-                        return True
-
-                rec_stack.remove(current_id)
+            snap = self._snapshot()
+            root_idx = snap.index.get(node_id)
+            if root_idx is None:
                 return False
 
-            return has_cycle(node_id)
+            # Iterative DFS with white/gray/black coloring: a back-edge
+            # to a gray node is a cycle. Explicit (node, iterator) frames
+            # avoid CPython recursion limits on deep dependency chains
+            WHITE, GRAY, BLACK = 0, 1, 2
+            color: Dict[int, int] = {root_idx: GRAY}
+            stack = [(root_idx, iter(snap.out_slice(root_idx)[0].tolist()))]
+
+            while stack:
+                u, neighbors = stack[-1]
+                for v in neighbors:
+                    state = color.get(v, WHITE)
+                    if state == GRAY:
+                        return True
+                    if state == WHITE:
+                        color[v] = GRAY
+                        stack.append((v, iter(snap.out_slice(v)[0].tolist())))
+                        break
+                else:
+                    color[u] = BLACK
+                    stack.pop()
+
+            return False
 
         except Exception as e:
             logger.error(f"Circular dependency check error: {e}")
             return False
 
-    def _calculate_path_strength(self, edge_ids: List[str]) -> float:
-        """Calculate total strength of a path"""
-        if not edge_ids:
+    @staticmethod
+    def _backtrack(
+        snap: _AdjacencySnapshot,
+        parents: Dict[Tuple[int, int], Tuple[int, int, float]],
+        end_state: Tuple[int, int],
+    ) -> Tuple[List[str], List[str], float]:
+        """Walk parent pointers back to the start; returns (nodes, edges, strength)"""
+        total_strength = parents[end_state][2]
+        nodes: List[str] = []
+        edges: List[str] = []
+        v, depth = end_state
+        while v != -1:
+            prev, e, _ = parents[(v, depth)]
+            nodes.append(snap.node_ids[v])
+            if e != -1:
+                edges.append(snap.edge_ids[e])
+            v, depth = prev, depth - 1
+        nodes.reverse()
+        edges.reverse()
+        return nodes, edges, total_strength
+
+    @staticmethod
+    def _calculate_path_strength(
+        snap: _AdjacencySnapshot,
+        edge_idx: Tuple[int, ...],
+    ) -> float:
+        """Product of the actual edge strengths along a path"""
+        if not edge_idx:
             return 1.0
+        return float(snap.edge_strength[list(edge_idx)].prod())
 
-        total = 1.0
-        for edge_id in edge_ids:
-            # Would need to retrieve edge and multiply strength
-            # For now, return conservative estimate
-            total *= 0.95  # Assume each edge is 95% confident
-
-        return total
+    _EWMA_ALPHA = 0.02
 
     def _update_stats(self, traversal_type: str, elapsed_ms: float, found: bool):
         """Update traversal statistics"""
@@ -424,10 +661,15 @@ class GraphTraversalEngine:
         if found:
             self.traversal_stats["paths_found"] += 1
 
-        # Update average
-        total = self.traversal_stats["total_traversals"]
-        avg = self.traversal_stats["avg_traversal_time_ms"]
-        self.traversal_stats["avg_traversal_time_ms"] = (avg * (total - 1) + elapsed_ms) / total
+        # Exponentially weighted moving average: constant-time, no
+        # cumulative rounding drift, and recent latencies dominate.
+        # The first sample seeds the average directly
+        if self.traversal_stats["total_traversals"] == 1:
+            self.traversal_stats["avg_traversal_time_ms"] = elapsed_ms
+        else:
+            avg = self.traversal_stats["avg_traversal_time_ms"]
+            self.traversal_stats["avg_traversal_time_ms"] = (
+                (1 - self._EWMA_ALPHA) * avg + self._EWMA_ALPHA * elapsed_ms)
 
     def get_stats(self) -> Dict:
         """Get traversal statistics"""
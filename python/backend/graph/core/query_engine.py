@@ -16,6 +16,7 @@ Agent-Focused Features:
 from dataclasses import dataclass
 from typing import List, Dict, Optional, Tuple
 from enum import Enum
+import asyncio
 import logging
 import time
 import uuid
@@ -85,6 +86,10 @@ class QueryEngine:
         self.traversal_engine = GraphTraversalEngine(db)
         self.explanation_generator = ExplanationGenerator(db)
         self.response_formatter = ResponseFormatter()
+        # Lazy trigram index over node labels for substring resolution;
+        # (node count version, trigram -> ids, id -> lowered label)
+        self._trigram_cache: Optional[
+            Tuple[int, Dict[str, set], Dict[str, str]]] = None
 
         self.query_stats = {
             "total_queries": 0,
@@ -233,6 +238,65 @@ class QueryEngine:
             logger.error(f"Search query error: {e}")
             raise
 
+    def _label_index(self) -> Tuple[Dict[str, set], Dict[str, str]]:
+        """
+        Get the in-memory trigram index over node labels, rebuilding
+        when the node count changes
+
+        Each 3-gram of a lowered label maps to the ids containing it,
+        so a substring query narrows to a few candidates by set
+        intersection instead of scanning every label.
+        """
+        version = self.db.node_count()
+        cached = self._trigram_cache
+        if cached is not None and cached[0] == version:
+            return cached[1], cached[2]
+
+        trigrams: Dict[str, set] = {}
+        labels: Dict[str, str] = {}
+        for node in self.db.iter_nodes():
+            low = node.label.lower()
+            labels[node.id] = low
+            for i in range(len(low) - 2):
+                trigrams.setdefault(low[i:i + 3], set()).add(node.id)
+
+        self._trigram_cache = (version, trigrams, labels)
+        return trigrams, labels
+
+    def _find_nodes_by_label(self, text: str, limit: int = 1) -> List[Node]:
+        """
+        Resolve a label substring to nodes via the trigram index
+
+        Trigram overlap is necessary but not sufficient, so surviving
+        candidates are verified with a real substring check. Queries
+        shorter than one trigram fall back to the SQL LIKE search.
+        """
+        query = text.strip().lower()
+        if len(query) < 3:
+            return self.db.find_nodes_by_label(query, limit=limit)
+
+        trigrams, labels = self._label_index()
+        candidates: Optional[set] = None
+        for i in range(len(query) - 2):
+            ids = trigrams.get(query[i:i + 3])
+            if not ids:
+                return []
+            candidates = set(ids) if candidates is None else candidates & ids
+            if not candidates:
+                return []
+
+        verified = sorted(nid for nid in candidates if query in labels[nid])
+        if not verified:
+            return []
+        selected = verified[:limit]
+        nodes_by_id = self.db.get_nodes_by_ids(selected)
+        return [nodes_by_id[nid] for nid in selected if nid in nodes_by_id]
+
+    def _find_node_by_label(self, text: str) -> Optional[Node]:
+        """First node whose label contains the given substring"""
+        matches = self._find_nodes_by_label(text, limit=1)
+        return matches[0] if matches else None
+
     async def _handle_integrate_query(
         self,
         request: QueryRequest,
@@ -248,30 +312,34 @@ class QueryEngine:
             source_label = parts[0].strip()
             target_label = parts[1].strip()
 
-            # Find nodes by label
-            all_nodes = self.db.get_nodes()
-            source = None
-            target = None
+            # Resolve labels through the in-memory trigram index; keep
+            # every match instead of letting the last one win
+            source_matches = self._find_nodes_by_label(source_label, limit=3)
+            target_matches = self._find_nodes_by_label(target_label, limit=3)
 
-            for node in all_nodes:
-                if source_label.lower() in node.label.lower():
-                    source = node
-                if target_label.lower() in node.label.lower():
-                    target = node
-
-            if not source or not target:
+            if not source_matches or not target_matches:
                 raise ValueError(f"Could not find nodes matching '{source_label}' or '{target_label}'")
 
-            # Find paths
+            # Find paths for every candidate pair concurrently
             traverse_start = time.time()
 
-            # Try to find multiple paths
-            paths = await self.traversal_engine.find_all_paths(
-                source.id,
-                target.id,
-                max_hops=4,
-                max_paths=3,
-            )
+            pairs = [(s, t)
+                     for s in source_matches for t in target_matches
+                     if s.id != t.id]
+            found_per_pair = await asyncio.gather(*[
+                self.traversal_engine.find_all_paths(
+                    s.id, t.id, max_hops=4, max_paths=3)
+                for s, t in pairs
+            ])
+
+            # Merge, best connections first, keeping each path's own
+            # endpoints for the explanations
+            ranked = [(path, s, t)
+                      for (s, t), found in zip(pairs, found_per_pair)
+                      for path in found]
+            ranked.sort(key=lambda entry: entry[0].confidence, reverse=True)
+            ranked = ranked[:3]
+            paths = [path for path, _, _ in ranked]
 
             traverse_time = (time.time() - traverse_start) * 1000
 
@@ -280,11 +348,11 @@ class QueryEngine:
             explain_start = time.time()
 
             if request.include_explanations and paths:
-                for path in paths[:2]:
+                for path, path_source, path_target in ranked[:2]:
                     exp = await self.explanation_generator.explain_path(
                         path,
-                        source,
-                        target,
+                        path_source,
+                        path_target,
                     )
                     explanations.append(exp)
 
@@ -319,44 +387,66 @@ class QueryEngine:
     ) -> str:
         """Handle suggestion query"""
         try:
-            # Get node by label
-            all_nodes = self.db.get_nodes()
-            target_node = None
-
-            for node in all_nodes:
-                if request.query_text.lower() in node.label.lower():
-                    target_node = node
-                    break
+            # Get node by label through the trigram index
+            target_node = self._find_node_by_label(request.query_text)
 
             if not target_node:
                 raise ValueError(f"Could not find node matching '{request.query_text}'")
 
-            # Get alternatives from related nodes
-            out_edges = self.db.get_edges_from_node(target_node.id)
-            in_edges = self.db.get_edges_to_node(target_node.id)
+            # Get alternatives from related nodes — both directions in
+            # one round trip
+            incident_edges = self.db.get_incident_edges(target_node.id)
 
             alternatives = []
             seen = set()
 
-            for edge in out_edges + in_edges:
+            for edge in incident_edges:
                 other_id = edge.target_id if edge.source_id == target_node.id else edge.source_id
                 if other_id not in seen:
                     alternatives.append(other_id)
                     seen.add(other_id)
 
-            # Create result objects for alternatives
+            # Create result objects for alternatives — one batched fetch
+            selected = alternatives[:request.limit]
+            nodes_by_id = self.db.get_nodes_by_ids(selected)
+
+            # Rank alternatives by cosine similarity to the target node:
+            # one matmul over the stacked neighbor embeddings instead of
+            # neighbors in insertion order with a hard-coded confidence
+            scores: Dict[str, float] = {}
+            vectors = self.db.get_embeddings_for_nodes(
+                selected + [target_node.id])
+            target_vec = vectors.get(target_node.id)
+            if target_vec is not None:
+                tv = target_vec.astype(np.float32)
+                tv /= np.linalg.norm(tv) + 1e-8
+                embedded = [nid for nid in selected if nid in vectors]
+                if embedded:
+                    E = np.stack([vectors[nid].astype(np.float32)
+                                  for nid in embedded])
+                    E /= np.linalg.norm(E, axis=1, keepdims=True) + 1e-8
+                    for nid, score in zip(embedded, E @ tv):
+                        scores[nid] = float(score)
+
+            # Scored alternatives first, best score leading; nodes with
+            # no embedding keep their edge-strength order at the tail
+            selected.sort(key=lambda nid: scores.get(nid, float('-inf')),
+                          reverse=True)
+
             results = []
-            for alt_id in alternatives[:request.limit]:
-                node = self.db.get_node(alt_id)
+            for alt_id in selected:
+                node = nodes_by_id.get(alt_id)
                 if node:
+                    score = scores.get(alt_id)
                     result = SearchResult(
                         node_id=node.id,
                         node_label=node.label,
                         node_type=node.metadata.get("type", "unknown"),
                         category=node.metadata.get("category", "uncategorized"),
                         description=node.description,
-                        confidence=0.7,
-                        similarity_score=0.0,
+                        confidence=(0.5 + 0.5 * score
+                                    if score is not None else 0.7),
+                        similarity_score=score if score is not None else 0.0,
                         relevance_score=0.0,
                         rank=len(results) + 1,
                         use_cases=node.metadata.get("use_cases", [])[:3],
@@ -417,6 +507,8 @@ class QueryEngine:
             logger.error(f"Validation query error: {e}")
             raise
 
+    _EWMA_ALPHA = 0.02
+
     def _update_stats(self, elapsed_ms: float, success: bool):
         """Update query statistics"""
         self.query_stats["total_queries"] += 1
@@ -426,10 +518,15 @@ class QueryEngine:
         else:
             self.query_stats["failed_queries"] += 1
 
-        # Update average
-        total = self.query_stats["total_queries"]
-        avg = self.query_stats["avg_query_time_ms"]
-        self.query_stats["avg_query_time_ms"] = (avg * (total - 1) + elapsed_ms) / total
+        # Exponentially weighted moving average: constant-time, no
+        # cumulative rounding drift, and recent latencies dominate.
+        # The first sample seeds the average directly
+        if self.query_stats["total_queries"] == 1:
+            self.query_stats["avg_query_time_ms"] = elapsed_ms
+        else:
+            avg = self.query_stats["avg_query_time_ms"]
+            self.query_stats["avg_query_time_ms"] = (
+                (1 - self._EWMA_ALPHA) * avg + self._EWMA_ALPHA * elapsed_ms)
 
     def get_stats(self) -> Dict:
         """Get query engine statistics"""
@@ -5,14 +5,47 @@ Build relationships between nodes that support agent planning
 
 import logging
 import json
-from typing import List, Dict, Optional, Tuple, Set
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import combinations
+from typing import Iterator, List, Dict, Optional, Tuple, Set
 from dataclasses import dataclass, field, asdict
 from enum import Enum
 import re
 
+import numpy as np
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    orjson = None
+    HAS_ORJSON = False
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    HAS_PYARROW = True
+except ImportError:
+    pa = None
+    pq = None
+    HAS_PYARROW = False
+
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _tail(node_id: str) -> str:
+    """Lowered tail of a node id (the text after the last dot)
+
+    The same ~2k node ids are looked up across builders and strength
+    calls, so caching makes repeat extractions a dict hit; rpartition
+    avoids the list that str.split allocates.
+    """
+    return node_id.rpartition('.')[2].lower()
+
+
 class RelationshipType(str, Enum):
     """Types of relationships between nodes"""
     COMPATIBLE_WITH = "compatible_with"
@@ -24,7 +57,7 @@ class RelationshipType(str, Enum):
     SIMILAR_TO = "similar_to"
 
 
-@dataclass
+@dataclass(slots=True)
 class AgenticEdge:
     """
     Relationship between nodes optimized for agent reasoning
@@ -64,6 +97,53 @@ class AgenticEdge:
         data['type'] = self.type.value
         return data
 
+    def _fast_dict(self) -> Dict:
+        """Serialization dict via direct attribute reads
+
+        Same shape as to_dict() but without asdict()'s recursive
+        deep-copy of every field — the hot save path only needs the
+        references, not copies.
+        """
+        return {
+            'id': self.id,
+            'source_id': self.source_id,
+            'target_id': self.target_id,
+            'type': self.type.value,
+            'strength': self.strength,
+            'reasoning': self.reasoning,
+            'success_rate': self.success_rate,
+            'common_pattern': self.common_pattern,
+            'common_config_mapping': self.common_config_mapping,
+            'gotchas': self.gotchas,
+            'agent_guidance': self.agent_guidance,
+            'metadata': self.metadata,
+        }
+
+    @staticmethod
+    def _make(id_, source_id, target_id, type_, strength, reasoning,
+              success_rate, common_pattern, common_config_mapping,
+              gotchas, agent_guidance) -> 'AgenticEdge':
+        """Construct an edge by direct slot assignment
+
+        The generated dataclass __init__ runs default handling for all
+        twelve fields on every call; the builder hot loops always supply
+        their values, so this factory skips straight to slot stores.
+        """
+        edge = AgenticEdge.__new__(AgenticEdge)
+        edge.id = id_
+        edge.source_id = source_id
+        edge.target_id = target_id
+        edge.type = type_
+        edge.strength = strength
+        edge.reasoning = reasoning
+        edge.success_rate = success_rate
+        edge.common_pattern = common_pattern
+        edge.common_config_mapping = common_config_mapping
+        edge.gotchas = gotchas
+        edge.agent_guidance = agent_guidance
+        edge.metadata = {}
+        return edge
+
     @classmethod
     def from_dict(cls, data: Dict) -> 'AgenticEdge':
         """Create from dictionary"""
@@ -191,10 +271,67 @@ class AgenticRelationshipBuilder:
         ],
     }
 
+    # Functionality groups for similar_to relationships
+    SIMILARITY_GROUPS = {
+        'Communication': ['slack', 'email', 'discord', 'telegram', 'teams'],
+        'HTTP': ['http', 'webhook', 'rest', 'api'],
+        'Database': ['database', 'postgres', 'mysql', 'mongodb', 'sql'],
+        'Storage': ['s3', 'ftp', 'sftp', 'dropbox', 'storage'],
+    }
+
+    # Keyword tables baked from the constants above at import time, so no
+    # builder or strength call has to re-derive them per invocation.
+    _PAIR_KEYWORDS = frozenset(kw for pair in COMPATIBLE_PAIRS for kw in pair)
+    _SCAN_KEYWORDS = frozenset(
+        kw for info in WORKFLOW_PATTERNS.values() for kw in info['nodes']
+    ) | frozenset(kw for kws in SIMILARITY_GROUPS.values() for kw in kws)
+
     def __init__(self):
         """Initialize relationship builder"""
         self.relationships: Dict[str, AgenticEdge] = {}
 
+    @staticmethod
+    def _prep(nodes: List) -> List[Tuple]:
+        """Lower each node's strings exactly once
+
+        Returns (node, id_lower, label_lower, id_tail) tuples so the
+        builders can unpack locals instead of re-running .lower() and
+        .rsplit() inside their inner loops.
+        """
+        return [
+            (
+                node,
+                node.id.lower(),
+                node.label.lower(),
+                _tail(node.id),
+            )
+            for node in nodes
+        ]
+
+    # Column order for the keyword-hit matrix below
+    _SCAN_COLUMNS = {kw: j for j, kw in enumerate(sorted(_SCAN_KEYWORDS))}
+
+    def _keyword_hits(self, prepped: List[Tuple]) -> np.ndarray:
+        """Scan each node once for every pattern/similarity keyword
+
+        Returns an N x K boolean matrix where hits[i, j] means keyword
+        column j (see _SCAN_COLUMNS) appears in node i's id or label.
+        The pattern and similarity builders answer their "which nodes
+        match this group" questions by indexing columns of the matrix
+        instead of re-scanning strings per group.
+        """
+        hits = np.zeros((len(prepped), len(self._SCAN_COLUMNS)), dtype=bool)
+        columns = self._SCAN_COLUMNS.items()
+        for i, (_node, id_lower, label_lower, _tail) in enumerate(prepped):
+            # '|' never appears in a keyword, so joining the two fields
+            # cannot create a spurious cross-boundary match.
+            haystack = f"{id_lower}|{label_lower}"
+            row = hits[i]
+            for kw, j in columns:
+                if kw in haystack:
+                    row[j] = True
+        return hits
+
     def build_relationships(self, nodes: List) -> List[AgenticEdge]:
         """
         Build all relationships between nodes
@@ -207,51 +344,45 @@ class AgenticRelationshipBuilder:
         """
         logger.info("Building relationships between nodes...")
 
-        # Get node IDs for quick lookup
-        node_ids = {node.id for node in nodes}
-        node_map = {node.id: node for node in nodes}
-        node_categories = {node.id: node.category for node in nodes}
-
-        edges = []
-        edge_id_counter = 0
-
-        # 1. Category relationships
-        logger.info("Building category relationships...")
-        category_edges = self._build_category_relationships(nodes)
-        edges.extend(category_edges)
-        logger.info(f"  Added {len(category_edges)} category relationships")
-        edge_id_counter += len(category_edges)
-
-        # 2. Compatible pairs
-        logger.info("Building compatibility relationships...")
-        compatible_edges = self._build_compatibility_relationships(nodes)
-        edges.extend(compatible_edges)
-        logger.info(f"  Added {len(compatible_edges)} compatibility relationships")
-        edge_id_counter += len(compatible_edges)
-
-        # 3. Pattern relationships
-        logger.info("Building pattern relationships...")
-        pattern_edges = self._build_pattern_relationships(nodes)
-        edges.extend(pattern_edges)
-        logger.info(f"  Added {len(pattern_edges)} pattern relationships")
-        edge_id_counter += len(pattern_edges)
-
-        # 4. Similarity relationships
-        logger.info("Building similarity relationships...")
-        similar_edges = self._build_similarity_relationships(nodes)
-        edges.extend(similar_edges)
-        logger.info(f"  Added {len(similar_edges)} similarity relationships")
+        # Lower node strings once, then scan them once for keyword hits
+        prepped = self._prep(nodes)
+        node_hits = self._keyword_hits(prepped)
+
+        # The four stages only read prepped/node_hits and the class
+        # constants, so they can run concurrently. Results are collected
+        # in stage order, keeping the output list identical to a
+        # sequential run.
+        stages = [
+            ('category', self._iter_category_edges, (prepped,)),
+            ('compatibility', self._iter_compat_edges, (prepped,)),
+            ('pattern', self._iter_pattern_edges, (prepped, node_hits)),
+            ('similarity', self._iter_similar_edges, (prepped, node_hits)),
+        ]
+        edges: List[AgenticEdge] = []
+        with ThreadPoolExecutor(max_workers=len(stages)) as pool:
+            futures = [
+                (stage_name, pool.submit(self._run_stage, builder, args))
+                for stage_name, builder, args in stages
+            ]
+            for stage_name, future in futures:
+                stage_edges = future.result()
+                edges.extend(stage_edges)
+                logger.info(f"  Added {len(stage_edges)} {stage_name} relationships")
 
         logger.info(f"Successfully built {len(edges)} total relationships")
         return edges
 
-    def _build_category_relationships(self, nodes: List) -> List[AgenticEdge]:
-        """Build belongs_to_category relationships"""
-        edges = []
+    @staticmethod
+    def _run_stage(builder, args) -> List[AgenticEdge]:
+        """Materialize one builder generator inside a worker thread"""
+        return list(builder(*args))
+
+    def _iter_category_edges(self, prepped: List[Tuple]) -> Iterator[AgenticEdge]:
+        """Yield belongs_to_category relationships"""
         categories = {}
 
         # Group nodes by category
-        for node in nodes:
+        for node, _id_lower, _label_lower, _tail in prepped:
             if node.category:
                 if node.category not in categories:
                     categories[node.category] = []
@@ -263,134 +394,177 @@ class AgenticRelationshipBuilder:
             # Create a "virtual" category node
             category_id = f"category-{category.lower().replace(' ', '-')}"
 
+            # These strings are identical for every node in the category;
+            # format and intern them once so all edges share one instance.
+            pattern = sys.intern(
+                f"All {category} nodes share common characteristics"
+            )
+            guidance = sys.intern(f"This node belongs to the {category} category")
+
             for node in category_nodes:
-                edge = AgenticEdge(
-                    id=f"edge-category-{edge_id}",
-                    source_id=node.id,
-                    target_id=category_id,
-                    type=RelationshipType.BELONGS_TO_CATEGORY,
-                    strength=1.0,
-                    reasoning=f"{node.label} is a {category} node",
-                    success_rate=1.0,
-                    common_pattern=f"All {category} nodes share common characteristics",
-                    agent_guidance=f"This node belongs to the {category} category"
+                yield AgenticEdge._make(
+                    f"edge-category-{edge_id}",
+                    node.id,
+                    category_id,
+                    RelationshipType.BELONGS_TO_CATEGORY,
+                    1.0,
+                    f"{node.label} is a {category} node",
+                    1.0,
+                    pattern,
+                    {},
+                    [],
+                    guidance
                 )
-                edges.append(edge)
                 edge_id += 1
 
-        return edges
-
-    def _build_compatibility_relationships(self, nodes: List) -> List[AgenticEdge]:
-        """Build compatible_with relationships"""
-        edges = []
-        node_map = {node.id: node for node in nodes}
-        edge_id = 0
-
-        for source in nodes:
-            for target in nodes:
-                if source.id == target.id:
-                    continue
-
-                # Check if this pair is in our known pairs
-                source_type = source.id.split('.')[-1].lower()
-                target_type = target.id.split('.')[-1].lower()
-
-                for (s_type, t_type), info in self.COMPATIBLE_PAIRS.items():
-                    if (s_type in source_type and t_type in target_type) or \
-                       (s_type in source.label.lower() and t_type in target.label.lower()):
-
-                        edge = AgenticEdge(
-                            id=f"edge-compat-{edge_id}",
-                            source_id=source.id,
-                            target_id=target.id,
-                            type=RelationshipType.COMPATIBLE_WITH,
-                            strength=info.get('strength', 0.8),
-                            reasoning=info.get('reasoning', ''),
-                            success_rate=info.get('success_rate', 0.85),
-                            common_pattern=f"{source.label} → {target.label}",
-                            common_config_mapping={
-                                'from': f'{source.label} output',
-                                'to': f'{target.label} input',
-                                'example': info.get('mapping', '')
-                            },
-                            gotchas=self.PAIR_GOTCHAS.get((s_type, t_type), []),
-                            agent_guidance=f"Use {target.label} after {source.label} to continue workflow"
-                        )
-                        edges.append(edge)
-                        edge_id += 1
-
-        return edges
+    def _iter_compat_edges(self, prepped: List[Tuple]) -> Iterator[AgenticEdge]:
+        """Yield compatible_with relationships"""
+        # Bucket node indices by which pair keywords appear in them, with
+        # id-tail and label hits kept separate since a pair only matches
+        # when both keywords hit the same field.  One pass over the nodes
+        # replaces the old nested scan that substring-tested every
+        # (source, target) combination against every pair.
+        keywords = self._PAIR_KEYWORDS
+        id_buckets: Dict[str, List[int]] = {kw: [] for kw in keywords}
+        label_buckets: Dict[str, List[int]] = {kw: [] for kw in keywords}
+        for idx, (_node, _id_lower, label_lower, id_tail) in enumerate(prepped):
+            for kw in keywords:
+                if kw in id_tail:
+                    id_buckets[kw].append(idx)
+                if kw in label_lower:
+                    label_buckets[kw].append(idx)
+
+        # Collect matches as (source_idx, target_idx, pair_rank) and sort so
+        # emission order (and therefore edge ids) matches the old scan.
+        pair_items = list(self.COMPATIBLE_PAIRS.items())
+        matches: List[Tuple[int, int, int]] = []
+        for rank, ((s_type, t_type), _info) in enumerate(pair_items):
+            hits = {
+                (s_idx, t_idx)
+                for s_idx in id_buckets[s_type]
+                for t_idx in id_buckets[t_type]
+            }
+            hits.update(
+                (s_idx, t_idx)
+                for s_idx in label_buckets[s_type]
+                for t_idx in label_buckets[t_type]
+            )
+            matches.extend(
+                (s_idx, t_idx, rank)
+                for s_idx, t_idx in hits
+                if prepped[s_idx][0].id != prepped[t_idx][0].id
+            )
+        matches.sort()
+
+        # A node's "X output" / "X input" strings repeat across every match
+        # it participates in; build them once per node index. The full
+        # mapping dict likewise repeats whenever the same (source, target)
+        # meets the same pair example, so identical dicts are shared
+        # (no consumer mutates them — they only get read or serialized).
+        from_cache: Dict[int, str] = {}
+        to_cache: Dict[int, str] = {}
+        mapping_cache: Dict[Tuple[int, int, str], Dict] = {}
+        for edge_id, (s_idx, t_idx, rank) in enumerate(matches):
+            source = prepped[s_idx][0]
+            target = prepped[t_idx][0]
+            (s_type, t_type), info = pair_items[rank]
+            mapping_from = from_cache.get(s_idx)
+            if mapping_from is None:
+                mapping_from = from_cache[s_idx] = f'{source.label} output'
+            mapping_to = to_cache.get(t_idx)
+            if mapping_to is None:
+                mapping_to = to_cache[t_idx] = f'{target.label} input'
+            example = info.get('mapping', '')
+            mapping_key = (s_idx, t_idx, example)
+            mapping = mapping_cache.get(mapping_key)
+            if mapping is None:
+                mapping = mapping_cache[mapping_key] = {
+                    'from': mapping_from,
+                    'to': mapping_to,
+                    'example': example
+                }
+            yield AgenticEdge._make(
+                f"edge-compat-{edge_id}",
+                source.id,
+                target.id,
+                RelationshipType.COMPATIBLE_WITH,
+                info.get('strength', 0.8),
+                info.get('reasoning', ''),
+                info.get('success_rate', 0.85),
+                f"{source.label} → {target.label}",
+                mapping,
+                self.PAIR_GOTCHAS.get((s_type, t_type), []),
+                f"Use {target.label} after {source.label} to continue workflow"
+            )
 
-    def _build_pattern_relationships(self, nodes: List) -> List[AgenticEdge]:
-        """Build used_in_pattern relationships"""
-        edges = []
-        node_map = {node.id.lower(): node for node in nodes}
+    def _iter_pattern_edges(
+        self, prepped: List[Tuple], node_hits: np.ndarray
+    ) -> Iterator[AgenticEdge]:
+        """Yield used_in_pattern relationships"""
         edge_id = 0
 
         for pattern_name, pattern_info in self.WORKFLOW_PATTERNS.items():
             pattern_id = f"pattern-{pattern_name.lower().replace(' ', '-')}"
+            success_rate = pattern_info.get('success_rate', 0.85)
+            guidance = sys.intern(
+                f"This node is commonly used in {pattern_name} workflows"
+            )
 
-            # Find nodes matching this pattern
-            for node_type in pattern_info['nodes']:
-                for node in nodes:
-                    if node_type in node.id.lower() or node_type in node.label.lower():
-                        edge = AgenticEdge(
-                            id=f"edge-pattern-{edge_id}",
-                            source_id=node.id,
-                            target_id=pattern_id,
-                            type=RelationshipType.USED_IN_PATTERN,
-                            strength=0.9,
-                            reasoning=f"{node.label} is used in {pattern_name} workflow",
-                            success_rate=pattern_info.get('success_rate', 0.85),
-                            common_pattern=pattern_name,
-                            agent_guidance=f"This node is commonly used in {pattern_name} workflows"
-                        )
-                        edges.append(edge)
-                        edge_id += 1
-
-        return edges
+            # One matrix query per pattern: a node is used in the pattern
+            # when any of the pattern's keyword columns hit. Each node is
+            # emitted once per pattern, even if it matches several of the
+            # pattern's keywords.
+            columns = [
+                self._SCAN_COLUMNS[kw] for kw in set(pattern_info['nodes'])
+            ]
+            mask = node_hits[:, columns].any(axis=1)
+            for i in np.nonzero(mask)[0]:
+                node = prepped[i][0]
+                yield AgenticEdge._make(
+                    f"edge-pattern-{edge_id}",
+                    node.id,
+                    pattern_id,
+                    RelationshipType.USED_IN_PATTERN,
+                    0.9,
+                    f"{node.label} is used in {pattern_name} workflow",
+                    success_rate,
+                    pattern_name,
+                    {},
+                    [],
+                    guidance
+                )
+                edge_id += 1
 
-    def _build_similarity_relationships(self, nodes: List) -> List[AgenticEdge]:
-        """Build similar_to relationships based on functionality"""
-        edges = []
+    def _iter_similar_edges(
+        self, prepped: List[Tuple], node_hits: np.ndarray
+    ) -> Iterator[AgenticEdge]:
+        """Yield similar_to relationships based on functionality"""
         edge_id = 0
 
-        # Similarity groups
-        similarity_groups = {
-            'Communication': ['slack', 'email', 'discord', 'telegram', 'teams'],
-            'HTTP': ['http', 'webhook', 'rest', 'api'],
-            'Database': ['database', 'postgres', 'mysql', 'mongodb', 'sql'],
-            'Storage': ['s3', 'ftp', 'sftp', 'dropbox', 'storage'],
-        }
-
-        node_map = {node.id.lower(): node for node in nodes}
-
-        for group_name, keywords in similarity_groups.items():
-            # Find nodes in this group
-            group_nodes = []
-            for node in nodes:
-                node_id_lower = node.id.lower()
-                if any(kw in node_id_lower or kw in node.label.lower() for kw in keywords):
-                    group_nodes.append(node)
-
-            # Create similarity relationships within group
-            for i, source in enumerate(group_nodes):
-                for target in group_nodes[i+1:]:
-                    edge = AgenticEdge(
-                        id=f"edge-similar-{edge_id}",
-                        source_id=source.id,
-                        target_id=target.id,
-                        type=RelationshipType.SIMILAR_TO,
-                        strength=0.8,
-                        reasoning=f"{source.label} and {target.label} provide similar functionality",
-                        success_rate=0.7,
-                        common_pattern=f"Alternative to {group_name}",
-                        agent_guidance=f"Consider {target.label} as an alternative to {source.label}"
-                    )
-                    edges.append(edge)
-                    edge_id += 1
-
-        return edges
+        for group_name, keywords in self.SIMILARITY_GROUPS.items():
+            # A node is in the group if any of the group's columns hit
+            columns = [self._SCAN_COLUMNS[kw] for kw in keywords]
+            mask = node_hits[:, columns].any(axis=1)
+            group_nodes = [prepped[i][0] for i in np.nonzero(mask)[0]]
+            alt_pattern = sys.intern(f"Alternative to {group_name}")
+
+            # Create similarity relationships within group; combinations
+            # walks the triangular pairs without allocating tail slices
+            for source, target in combinations(group_nodes, 2):
+                yield AgenticEdge._make(
+                    f"edge-similar-{edge_id}",
+                    source.id,
+                    target.id,
+                    RelationshipType.SIMILAR_TO,
+                    0.8,
+                    f"{source.label} and {target.label} provide similar functionality",
+                    0.7,
+                    alt_pattern,
+                    {},
+                    [],
+                    f"Consider {target.label} as an alternative to {source.label}"
+                )
+                edge_id += 1
 
     def calculate_compatibility_strength(
         self,
@@ -411,30 +585,62 @@ class AgenticRelationshipBuilder:
         """
         strength = 0.5  # Base strength
 
-        # Check if they're in known compatible pairs
-        source_type = source_node.id.split('.')[-1].lower()
-        target_type = target_node.id.split('.')[-1].lower()
-
-        for (s_type, t_type), info in self.COMPATIBLE_PAIRS.items():
-            if (s_type in source_type and t_type in target_type):
-                strength = info.get('strength', 0.8)
-                break
+        source_type = _tail(source_node.id)
+        target_type = _tail(target_node.id)
+
+        # Exact pair key first (O(1) for clean type tails), falling back
+        # to the keyword-set match only when the exact key misses.
+        info = self.COMPATIBLE_PAIRS.get((source_type, target_type))
+        if info is not None:
+            strength = info.get('strength', 0.8)
+        else:
+            s_kws = {kw for kw in self._PAIR_KEYWORDS if kw in source_type}
+            t_kws = {kw for kw in self._PAIR_KEYWORDS if kw in target_type}
+            if s_kws and t_kws:
+                for (s_type, t_type), pair_info in self.COMPATIBLE_PAIRS.items():
+                    if s_type in s_kws and t_type in t_kws:
+                        strength = pair_info.get('strength', 0.8)
+                        break
 
         # If we have workflow data, adjust based on actual usage
         if existing_workflows:
+            wf_id_sets = [self._collect_ids(wf) for wf in existing_workflows]
             usage_count = sum(
-                1 for wf in existing_workflows
-                if source_node.id in str(wf) and target_node.id in str(wf)
+                1 for ids in wf_id_sets
+                if source_node.id in ids and target_node.id in ids
             )
             if usage_count > 0:
                 strength = min(1.0, strength + 0.1)
 
         return strength
 
+    @classmethod
+    def _collect_ids(cls, obj) -> frozenset:
+        """Collect every string value reachable in a workflow dict
+
+        One walk per workflow replaces the old str(workflow) rendering,
+        which serialized the whole dict per membership test.
+        """
+        out: Set[str] = set()
+        cls._walk_strings(obj, out)
+        return frozenset(out)
+
+    @classmethod
+    def _walk_strings(cls, obj, out: Set[str]) -> None:
+        if isinstance(obj, str):
+            out.add(obj)
+        elif isinstance(obj, dict):
+            for key, value in obj.items():
+                cls._walk_strings(key, out)
+                cls._walk_strings(value, out)
+        elif isinstance(obj, (list, tuple)):
+            for item in obj:
+                cls._walk_strings(item, out)
+
     def extract_gotchas(self, source_node, target_node) -> List[str]:
         """Get common gotchas for node pair"""
-        source_type = source_node.id.split('.')[-1].lower()
-        target_type = target_node.id.split('.')[-1].lower()
+        source_type = _tail(source_node.id)
+        target_type = _tail(target_node.id)
 
         return self.PAIR_GOTCHAS.get((source_type, target_type), [
             f"Test {source_node.label} → {target_node.label} sequence",
@@ -442,13 +648,90 @@ class AgenticRelationshipBuilder:
             f"Check {target_node.label} prerequisites"
         ])
 
+    def save(self, edges: List[AgenticEdge], output_path: str) -> bool:
+        """Save relationships, picking the format from the file extension
+
+        '.parquet' writes a columnar Parquet table when pyarrow is
+        installed; everything else (and the fallback when it is not)
+        goes through the JSON writer.
+        """
+        if output_path.endswith('.parquet') and HAS_PYARROW:
+            return self.save_to_parquet(edges, output_path)
+        return self.save_to_json(edges, output_path)
+
+    def save_to_parquet(self, edges: List[AgenticEdge], output_path: str) -> bool:
+        """Save relationships as a columnar Parquet table
+
+        All edges share a fixed schema, so columnar storage with
+        dictionary encoding on the low-cardinality columns (type,
+        common_pattern, reasoning) compresses the heavy repetition far
+        better than row-wise JSON and reloads vectorized. The nested
+        dict/list fields are stored as JSON text columns.
+        """
+        if not HAS_PYARROW:
+            logger.error("pyarrow is not installed; cannot write Parquet")
+            return False
+        try:
+            columns: Dict[str, List] = {
+                'id': [], 'source_id': [], 'target_id': [], 'type': [],
+                'strength': [], 'reasoning': [], 'success_rate': [],
+                'common_pattern': [], 'common_config_mapping': [],
+                'gotchas': [], 'agent_guidance': [], 'metadata': [],
+            }
+            count = 0
+            for edge in edges:
+                columns['id'].append(edge.id)
+                columns['source_id'].append(edge.source_id)
+                columns['target_id'].append(edge.target_id)
+                columns['type'].append(edge.type.value)
+                columns['strength'].append(edge.strength)
+                columns['reasoning'].append(edge.reasoning)
+                columns['success_rate'].append(edge.success_rate)
+                columns['common_pattern'].append(edge.common_pattern)
+                columns['common_config_mapping'].append(
+                    json.dumps(edge.common_config_mapping)
+                )
+                columns['gotchas'].append(json.dumps(edge.gotchas))
+                columns['agent_guidance'].append(edge.agent_guidance)
+                columns['metadata'].append(json.dumps(edge.metadata))
+                count += 1
+            table = pa.Table.from_pydict(columns)
+            pq.write_table(
+                table,
+                output_path,
+                compression='zstd',
+                use_dictionary=['type', 'common_pattern', 'reasoning'],
+            )
+            logger.info(f"Saved {count} relationships to {output_path}")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to save relationships: {e}")
+            return False
+
     def save_to_json(self, edges: List[AgenticEdge], output_path: str) -> bool:
-        """Save relationships to JSON"""
+        """Save relationships to JSON, via orjson when available
+
+        Edges are streamed to the file one record at a time, so peak
+        memory stays at one serialized edge regardless of how many edges
+        the build produced (and any iterable of edges works, not just a
+        list).
+        """
+        if HAS_ORJSON:
+            indent = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            dump = lambda d: orjson.dumps(d, option=indent)
+        else:
+            dump = lambda d: json.dumps(d, indent=2, default=str).encode('utf-8')
         try:
-            data = [edge.to_dict() for edge in edges]
-            with open(output_path, 'w') as f:
-                json.dump(data, f, indent=2, default=str)
-            logger.info(f"Saved {len(edges)} relationships to {output_path}")
+            count = 0
+            with open(output_path, 'wb') as f:
+                f.write(b'[')
+                for edge in edges:
+                    if count:
+                        f.write(b',\n')
+                    f.write(dump(edge._fast_dict()))
+                    count += 1
+                f.write(b']')
+            logger.info(f"Saved {count} relationships to {output_path}")
             return True
         except Exception as e:
             logger.error(f"Failed to save relationships: {e}")
@@ -94,6 +94,11 @@ class SemanticSearchEngine:
         """
         self.db = db
         self.embedding_cache = {}  # Cache for frequently accessed embeddings
+        # Packed float16 embedding matrix (loaded lazily on first search)
+        self._matrix: Optional[np.ndarray] = None
+        self._id_to_row: Optional[Dict[str, int]] = None
+        self._row_norms: Optional[np.ndarray] = None
+        self._matrix_loaded = False
         self.search_stats = {
             "total_searches": 0,
             "semantic_searches": 0,
@@ -131,6 +136,11 @@ class SemanticSearchEngine:
             # Get all nodes (would be optimized in production)
             all_nodes = self.db.get_nodes(limit=10000)
 
+            # Score the whole graph with one matrix product when the
+            # packed float16 matrix is available; per-node DB lookups
+            # remain as fallback for graphs built before it existed
+            sims_by_row = self._score_all(query_embedding)
+
             results = []
 
             for node in all_nodes:
@@ -140,16 +150,22 @@ class SemanticSearchEngine:
                 if node_type_filter and node.metadata.get("type") != node_type_filter:
                     continue
 
-                # Get node embedding
-                embedding = self.db.get_embedding(node.id)
-                if embedding is None:
-                    continue
+                if sims_by_row is not None:
+                    row = self._id_to_row.get(node.id)
+                    if row is None:
+                        continue
+                    similarity = float(sims_by_row[row])
+                else:
+                    # Get node embedding
+                    embedding = self.db.get_embedding(node.id)
+                    if embedding is None:
+                        continue
 
-                # Calculate cosine similarity
-                similarity = self._cosine_similarity(
-                    query_embedding,
-                    embedding.vector
-                )
+                    # Calculate cosine similarity
+                    similarity = self._cosine_similarity(
+                        query_embedding,
+                        embedding.vector
+                    )
 
                 # Calculate confidence (higher similarity = higher confidence)
                 confidence = max(0.0, min(1.0, similarity))
@@ -381,6 +397,34 @@ class SemanticSearchEngine:
             logger.error(f"Hybrid search error: {e}")
             return []
 
+    def _load_embedding_matrix(self):
+        """Load the packed embedding matrix once, if the graph has one"""
+        if self._matrix_loaded:
+            return
+        self._matrix_loaded = True
+        packed = self.db.get_embedding_matrix()
+        if packed is None:
+            return
+        matrix, node_ids = packed
+        self._matrix = matrix
+        self._id_to_row = {nid: i for i, nid in enumerate(node_ids)}
+        self._row_norms = np.linalg.norm(
+            matrix.astype(np.float32), axis=1) + 1e-8
+
+    def _score_all(self, query_embedding: np.ndarray) -> Optional[np.ndarray]:
+        """
+        Cosine-score every stored vector against the query in one matmul
+
+        Returns scores in matrix row order on the same [0, 1] scale as
+        _cosine_similarity, or None when no packed matrix is stored.
+        """
+        self._load_embedding_matrix()
+        if self._matrix is None:
+            return None
+        query_norm = query_embedding / (np.linalg.norm(query_embedding) + 1e-8)
+        dots = (self._matrix @ query_norm.astype(np.float16)).astype(np.float32)
+        return np.clip((dots / self._row_norms + 1) / 2, 0.0, 1.0)
+
     def _cosine_similarity(self, vec1: np.ndarray, vec2: np.ndarray) -> float:
         """
         Calculate cosine similarity between two vectors
@@ -454,15 +498,10 @@ class SemanticSearchEngine:
         try:
             related_set = set()
 
-            # Get outgoing edges
-            out_edges = self.db.get_edges_from_node(node_id)
-            for edge in out_edges:
-                related_set.add(edge.target_id)
-
-            # Get incoming edges
-            in_edges = self.db.get_edges_to_node(node_id)
-            for edge in in_edges:
-                related_set.add(edge.source_id)
+            # Both directions in one round trip
+            for edge in self.db.get_incident_edges(node_id):
+                related_set.add(edge.target_id if edge.source_id == node_id
+                                else edge.source_id)
 
             return list(related_set)[:limit]
 
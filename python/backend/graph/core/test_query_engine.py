@@ -105,18 +105,42 @@ class MockDatabase:
     def get_nodes(self):
         return list(self.nodes.values())
 
+    def iter_nodes(self, batch_size=1000):
+        yield from self.nodes.values()
+
+    def node_count(self):
+        return len(self.nodes)
+
     def get_node(self, node_id):
         return self.nodes.get(node_id)
 
+    def get_nodes_by_ids(self, node_ids):
+        return {nid: self.nodes[nid] for nid in node_ids if nid in self.nodes}
+
+    def find_nodes_by_label(self, pattern, limit=10):
+        pattern = pattern.lower()
+        matches = [n for n in self.nodes.values()
+                   if pattern in n.label.lower()]
+        return matches[:limit]
+
     def get_embedding(self, node_id):
         return self.embeddings.get(node_id)
 
+    def get_embeddings_for_nodes(self, node_ids):
+        return {nid: self.embeddings[nid].vector
+                for nid in node_ids if nid in self.embeddings}
+
     def get_edges_from_node(self, node_id):
         return self.edges.get(f"{node_id}_out", [])
 
     def get_edges_to_node(self, node_id):
         return self.edges.get(f"{node_id}_in", [])
 
+    def get_incident_edges(self, node_id):
+        incoming = [e for e in self.edges.get(f"{node_id}_in", [])
+                    if e.source_id != node_id]
+        return self.edges.get(f"{node_id}_out", []) + incoming
+
     def add_edge(self, source_id, target_id, edge_type, strength=1.0):
         """Add mock edge"""
         edge = Mock(
@@ -135,6 +159,15 @@ class MockDatabase:
         self.edges[key_out].append(edge)
         self.edges[key_in].append(edge)
 
+    def edge_count(self):
+        return sum(len(edges) for key, edges in self.edges.items()
+                   if key.endswith("_out"))
+
+    def get_edge_topology(self):
+        return [(e.id, e.source_id, e.target_id, e.strength, e.type)
+                for key, edges in self.edges.items() if key.endswith("_out")
+                for e in edges]
+
 
 # Tests for Semantic Search Engine
 class TestSemanticSearchEngine:
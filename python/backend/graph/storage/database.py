@@ -158,6 +158,77 @@ class Database:
             logger.error(f"Failed to add node {node.id}: {e}")
             return False
 
+    def add_nodes_bulk(self, nodes: List[Node]) -> int:
+        """
+        Add many nodes in one transaction
+
+        executemany under a single commit collapses N per-row
+        transactions (each paying an fsync) into one. Update history gets
+        a single summary entry instead of one row per node.
+
+        Args:
+            nodes: Node instances to store
+
+        Returns:
+            Number of rows written, 0 on failure
+        """
+        if not nodes:
+            return 0
+        try:
+            with self.transaction() as conn:
+                cursor = conn.cursor()
+                cursor.executemany(
+                    """
+                    INSERT OR REPLACE INTO nodes
+                    (id, label, description, category, keywords, embedding, metadata, created_at, updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    ((d['id'], d['label'], d['description'], d['category'],
+                      d['keywords'], d['embedding'], d['metadata'],
+                      d['created_at'], d['updated_at'])
+                     for d in (n.to_dict() for n in nodes))
+                )
+                self._log_update(conn, 'bulk', EntityType.NODE, 'add_bulk',
+                                 None, json.dumps({'count': len(nodes)}))
+            return len(nodes)
+        except Exception as e:
+            logger.warning(f"Bulk node insert failed ({e}), retrying per row")
+            return sum(1 for node in nodes if self.add_node(node))
+
+    def add_node_rows(self, rows) -> int:
+        """
+        Add pre-serialized node rows in one transaction
+
+        Rows are tuples already matching the nodes column order
+        (id, label, description, category, keywords, embedding, metadata,
+        created_at, updated_at) with keywords/metadata as JSON text. Lets
+        bulk loaders skip the Node dataclass and to_dict() per row.
+
+        Args:
+            rows: Iterable of 9-tuples in column order
+
+        Returns:
+            Number of rows written, 0 on failure
+        """
+        try:
+            with self.transaction() as conn:
+                cursor = conn.cursor()
+                cursor.executemany(
+                    """
+                    INSERT OR REPLACE INTO nodes
+                    (id, label, description, category, keywords, embedding, metadata, created_at, updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    rows
+                )
+                written = cursor.rowcount
+                self._log_update(conn, 'bulk', EntityType.NODE, 'add_bulk',
+                                 None, json.dumps({'count': written}))
+            return max(written, 0)
+        except Exception as e:
+            logger.error(f"Failed to bulk add node rows: {e}")
+            return 0
+
     def get_node(self, node_id: str) -> Optional[Node]:
         """Get a node by ID"""
         try:
@@ -188,6 +259,100 @@ class Database:
             logger.error(f"Failed to get nodes: {e}")
             return []
 
+    def iter_nodes(self, batch_size: int = 1000):
+        """
+        Iterate over all nodes in bounded batches
+
+        Uses keyset pagination on id so memory stays constant regardless
+        of graph size, unlike get_nodes(limit=...) which materializes
+        every row up front.
+
+        Args:
+            batch_size: Number of rows fetched per query
+
+        Yields:
+            Node instances in id order
+        """
+        last_id = ''
+        while True:
+            try:
+                with self.get_connection() as conn:
+                    cursor = conn.cursor()
+                    cursor.execute(
+                        "SELECT * FROM nodes WHERE id > ? ORDER BY id LIMIT ?",
+                        (last_id, batch_size)
+                    )
+                    rows = cursor.fetchall()
+            except Exception as e:
+                logger.error(f"Failed to iterate nodes: {e}")
+                return
+
+            if not rows:
+                return
+
+            for row in rows:
+                yield Node.from_dict(dict(row))
+            last_id = rows[-1]['id']
+
+    def get_nodes_by_ids(self, node_ids: List[str]) -> Dict[str, Node]:
+        """
+        Get many nodes by id in a single query
+
+        One IN (...) select replaces N get_node round-trips for callers
+        resolving a batch of ids (path explanations, traversal output).
+
+        Args:
+            node_ids: Node ids to fetch
+
+        Returns:
+            Mapping of id to Node for every id that exists
+        """
+        if not node_ids:
+            return {}
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                placeholders = ','.join('?' * len(node_ids))
+                cursor.execute(
+                    f"SELECT * FROM nodes WHERE id IN ({placeholders})",
+                    tuple(node_ids)
+                )
+                return {row['id']: Node.from_dict(dict(row))
+                        for row in cursor.fetchall()}
+        except Exception as e:
+            logger.error(f"Failed to get nodes by ids: {e}")
+            return {}
+
+    def find_nodes_by_label(self, pattern: str, limit: int = 10) -> List[Node]:
+        """
+        Find nodes whose label contains a substring, case-insensitively
+
+        One LIKE query with the filtering pushed into SQLite instead of
+        fetching every node and scanning labels in Python. Wildcard
+        characters in the pattern are escaped so they match literally.
+
+        Args:
+            pattern: Substring to match within labels
+            limit: Max nodes to return
+
+        Returns:
+            Matching nodes ordered by label
+        """
+        try:
+            escaped = (pattern.replace('\\', '\\\\')
+                       .replace('%', '\\%').replace('_', '\\_'))
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    "SELECT * FROM nodes WHERE label LIKE ? ESCAPE '\\' "
+                    "ORDER BY label LIMIT ?",
+                    (f"%{escaped}%", limit)
+                )
+                return [Node.from_dict(dict(row)) for row in cursor.fetchall()]
+        except Exception as e:
+            logger.error(f"Failed to find nodes by label '{pattern}': {e}")
+            return []
+
     def get_nodes_by_category(self, category: str) -> List[Node]:
         """Get all nodes in a category"""
         try:
@@ -212,6 +377,36 @@ class Database:
             logger.error(f"Failed to delete node {node_id}: {e}")
             return False
 
+    def get_all_node_ids(self) -> set:
+        """
+        Get the ids of every stored node as a set
+
+        One SELECT replaces per-row existence probes for bulk loaders
+        filtering duplicates locally before insert.
+        """
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("SELECT id FROM nodes")
+                return {row[0] for row in cursor.fetchall()}
+        except Exception as e:
+            logger.error(f"Failed to get node ids: {e}")
+            return set()
+
+    def get_category_counts(self) -> Dict[str, int]:
+        """Get node counts per category via a single SQL aggregate"""
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    "SELECT category, COUNT(*) FROM nodes "
+                    "WHERE category IS NOT NULL GROUP BY category"
+                )
+                return {row[0]: row[1] for row in cursor.fetchall()}
+        except Exception as e:
+            logger.error(f"Failed to get category counts: {e}")
+            return {}
+
     def node_count(self) -> int:
         """Get total number of nodes"""
         try:
@@ -250,6 +445,105 @@ class Database:
             logger.error(f"Failed to add edge {edge.id}: {e}")
             return False
 
+    def add_edges_bulk(self, edges: List[Edge]) -> int:
+        """
+        Add many edges in one transaction
+
+        Same batching rationale as add_nodes_bulk: one commit for the
+        whole set plus a single summary history entry.
+
+        Args:
+            edges: Edge instances to store
+
+        Returns:
+            Number of rows written, 0 on failure
+        """
+        if not edges:
+            return 0
+        try:
+            with self.transaction() as conn:
+                cursor = conn.cursor()
+                cursor.executemany(
+                    """
+                    INSERT OR REPLACE INTO edges
+                    (id, source_id, target_id, type, strength, metadata, created_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    ((d['id'], d['source_id'], d['target_id'], d['type'],
+                      d['strength'], d['metadata'], d['created_at'])
+                     for d in (e.to_dict() for e in edges))
+                )
+                self._log_update(conn, 'bulk', EntityType.NODE, 'add_edge_bulk',
+                                 None, json.dumps({'count': len(edges)}))
+            return len(edges)
+        except Exception as e:
+            # A single bad row (e.g. an edge to a node that was never
+            # stored) aborts the whole executemany; retry row by row so
+            # the valid remainder still lands, as the per-row path did
+            logger.warning(f"Bulk edge insert failed ({e}), retrying per row")
+            return sum(1 for edge in edges if self.add_edge(edge))
+
+    def add_edge_rows(self, rows) -> int:
+        """
+        Add pre-serialized edge rows in one transaction
+
+        Rows are tuples already matching the edges column order
+        (id, source_id, target_id, type, strength, metadata, created_at)
+        with metadata as JSON text. Lets bulk loaders skip the Edge
+        dataclass and to_dict() per row. Falls back to per-row inserts so
+        one bad edge (e.g. pointing at a node that was never stored) does
+        not drop the whole chunk.
+
+        Args:
+            rows: Iterable of 7-tuples in column order
+
+        Returns:
+            Number of rows written, 0 on failure
+        """
+        rows = rows if isinstance(rows, list) else list(rows)
+        if not rows:
+            return 0
+        insert_sql = """
+            INSERT OR REPLACE INTO edges
+            (id, source_id, target_id, type, strength, metadata, created_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        """
+        try:
+            with self.transaction() as conn:
+                cursor = conn.cursor()
+                cursor.executemany(insert_sql, rows)
+                written = cursor.rowcount
+                self._log_update(conn, 'bulk', EntityType.NODE, 'add_edge_bulk',
+                                 None, json.dumps({'count': written}))
+            return max(written, 0)
+        except Exception as e:
+            logger.warning(f"Bulk edge row insert failed ({e}), retrying per row")
+            stored = 0
+            for row in rows:
+                try:
+                    with self.transaction() as conn:
+                        conn.cursor().execute(insert_sql, row)
+                    stored += 1
+                except Exception:
+                    continue
+            return stored
+
+    def get_all_edge_keys(self) -> set:
+        """
+        Get (source_id, target_id, type) for every stored edge as a set
+
+        Companion to get_all_node_ids for bulk loaders deduplicating
+        relationships before insert.
+        """
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("SELECT source_id, target_id, type FROM edges")
+                return {(row[0], row[1], row[2]) for row in cursor.fetchall()}
+        except Exception as e:
+            logger.error(f"Failed to get edge keys: {e}")
+            return set()
+
     def get_edges_from_node(self, source_id: str) -> List[Edge]:
         """Get all edges from a source node"""
         try:
@@ -280,6 +574,31 @@ class Database:
             logger.error(f"Failed to get edges to {target_id}: {e}")
             return []
 
+    def get_incident_edges(self, node_id: str) -> List[Edge]:
+        """
+        Get all edges touching a node, in either direction
+
+        One UNION ALL round trip instead of separate from/to queries;
+        self-loops are returned once.
+        """
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    """
+                    SELECT * FROM edges WHERE source_id = ?
+                    UNION ALL
+                    SELECT * FROM edges WHERE target_id = ? AND source_id != ?
+                    ORDER BY strength DESC
+                    """,
+                    (node_id, node_id, node_id)
+                )
+                rows = cursor.fetchall()
+                return [Edge.from_dict(dict(row)) for row in rows]
+        except Exception as e:
+            logger.error(f"Failed to get incident edges for {node_id}: {e}")
+            return []
+
     def delete_edge(self, edge_id: str) -> bool:
         """Delete an edge from the graph"""
         try:
@@ -292,6 +611,26 @@ class Database:
             logger.error(f"Failed to delete edge {edge_id}: {e}")
             return False
 
+    def get_edge_topology(self) -> List[Tuple[str, str, str, float, str]]:
+        """
+        Get (id, source_id, target_id, strength, type) for every edge
+
+        One lean scan for callers building in-memory adjacency — skips
+        Edge construction and metadata JSON parsing entirely.
+
+        Returns:
+            List of raw edge tuples
+        """
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    "SELECT id, source_id, target_id, strength, type FROM edges")
+                return [tuple(row) for row in cursor.fetchall()]
+        except Exception as e:
+            logger.error(f"Failed to get edge topology: {e}")
+            return []
+
     def edge_count(self) -> int:
         """Get total number of edges"""
         try:
@@ -342,6 +681,92 @@ class Database:
             logger.error(f"Failed to add embedding for {embedding.node_id}: {e}")
             return False
 
+    def add_embeddings_bulk(self, embeddings: List[Embedding]) -> int:
+        """
+        Add many embeddings in one transaction
+
+        Uses executemany under a single commit, so inserting N rows costs
+        one fsync instead of N — the per-row add_embedding path spends
+        most of its time in transaction overhead for bulk loads.
+
+        Args:
+            embeddings: Embedding instances to store
+
+        Returns:
+            Number of rows written, 0 on failure
+        """
+        if not embeddings:
+            return 0
+        try:
+            with self.transaction() as conn:
+                cursor = conn.cursor()
+                cursor.executemany(
+                    """
+                    INSERT OR REPLACE INTO embeddings
+                    (id, node_id, embedding, dimension, model, created_at, updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    ((d['id'], d['node_id'], d['embedding'], d['dimension'],
+                      d['model'], d['created_at'], d['updated_at'])
+                     for d in (e.to_dict() for e in embeddings))
+                )
+            return len(embeddings)
+        except Exception as e:
+            logger.error(f"Failed to bulk add embeddings: {e}")
+            return 0
+
+    def get_embedded_node_ids(self, model: Optional[str] = None) -> set:
+        """
+        Get node ids that already have a stored embedding
+
+        Lets re-embedding runs skip unchanged nodes with one SELECT
+        instead of probing per node.
+
+        Args:
+            model: Optional model filter
+
+        Returns:
+            Set of node ids with an embedding row
+        """
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                if model:
+                    cursor.execute(
+                        "SELECT node_id FROM embeddings WHERE model = ?", (model,))
+                else:
+                    cursor.execute("SELECT node_id FROM embeddings")
+                return {row[0] for row in cursor.fetchall()}
+        except Exception as e:
+            logger.error(f"Failed to get embedded node ids: {e}")
+            return set()
+
+    def get_embeddings_for_nodes(self, node_ids: List[str]) -> Dict[str, np.ndarray]:
+        """
+        Get embedding vectors for many nodes in one query
+
+        Args:
+            node_ids: Node ids to fetch vectors for
+
+        Returns:
+            Mapping of node id to float32 vector for every id that has one
+        """
+        if not node_ids:
+            return {}
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                placeholders = ','.join('?' * len(node_ids))
+                cursor.execute(
+                    f"SELECT node_id, embedding FROM embeddings WHERE node_id IN ({placeholders})",
+                    tuple(node_ids)
+                )
+                return {row[0]: np.frombuffer(row[1], dtype=np.float32)
+                        for row in cursor.fetchall()}
+        except Exception as e:
+            logger.error(f"Failed to get embeddings by node ids: {e}")
+            return {}
+
     def get_embedding(self, node_id: str) -> Optional[Embedding]:
         """Get embedding for a node"""
         try:
@@ -357,6 +782,73 @@ class Database:
             logger.error(f"Failed to get embedding for {node_id}: {e}")
             return None
 
+    def set_embedding_matrix(self, model: str, node_ids: List[str],
+                             matrix: np.ndarray) -> bool:
+        """
+        Store the packed embedding matrix for a model
+
+        All vectors go into one contiguous float16 blob (half the bytes
+        of per-row float32) plus the row-order id list, so similarity
+        search can score the whole graph with a single matrix product
+        instead of a SELECT and dot product per node.
+
+        Args:
+            model: Embedding model name
+            node_ids: Node ids in matrix row order
+            matrix: Array of shape (len(node_ids), dimension)
+
+        Returns:
+            True if successful
+        """
+        try:
+            packed = np.ascontiguousarray(matrix, dtype=np.float16)
+            with self.transaction() as conn:
+                conn.cursor().execute(
+                    """
+                    INSERT OR REPLACE INTO embedding_matrix
+                    (model, node_ids, matrix, dimension, rows, updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    """,
+                    (model, json.dumps(list(node_ids)), packed.tobytes(),
+                     packed.shape[1], packed.shape[0],
+                     int(datetime.now().timestamp()))
+                )
+            return True
+        except Exception as e:
+            logger.error(f"Failed to store embedding matrix for {model}: {e}")
+            return False
+
+    def get_embedding_matrix(
+        self, model: Optional[str] = None
+    ) -> Optional[Tuple[np.ndarray, List[str]]]:
+        """
+        Load the packed embedding matrix
+
+        Args:
+            model: Model name; defaults to the most recently stored matrix
+
+        Returns:
+            (matrix, node_ids) where matrix is float16 with shape
+            (len(node_ids), dimension), or None if no matrix is stored
+        """
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                if model:
+                    cursor.execute(
+                        "SELECT * FROM embedding_matrix WHERE model = ?", (model,))
+                else:
+                    cursor.execute(
+                        "SELECT * FROM embedding_matrix ORDER BY updated_at DESC LIMIT 1")
+                row = cursor.fetchone()
+                if not row:
+                    return None
+                matrix = np.frombuffer(row['matrix'], dtype=np.float16)
+                return matrix.reshape(row['rows'], row['dimension']), json.loads(row['node_ids'])
+        except Exception as e:
+            logger.error(f"Failed to load embedding matrix: {e}")
+            return None
+
     # Metadata Operations
     def set_metadata(self, key: str, value: str) -> bool:
         """Set a metadata value"""
@@ -375,6 +867,29 @@ class Database:
             logger.error(f"Failed to set metadata {key}: {e}")
             return False
 
+    def set_metadata_bulk(self, entries) -> bool:
+        """
+        Set many metadata values in one transaction
+
+        Args:
+            entries: Iterable of (key, value) pairs
+
+        Returns:
+            True if successful
+        """
+        try:
+            with self.transaction() as conn:
+                cursor = conn.cursor()
+                now = int(datetime.now().timestamp())
+                cursor.executemany(
+                    "INSERT OR REPLACE INTO graph_metadata (key, value, updated_at) VALUES (?, ?, ?)",
+                    ((key, value, now) for key, value in entries)
+                )
+            return True
+        except Exception as e:
+            logger.error(f"Failed to bulk set metadata: {e}")
+            return False
+
     def get_metadata(self, key: str) -> Optional[str]:
         """Get a metadata value"""
         try:
@@ -10,6 +10,27 @@ import json
 import numpy as np
 from enum import Enum
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    orjson = None
+    HAS_ORJSON = False
+
+
+def _dumps_text(obj) -> str:
+    """Serialize to JSON text for a TEXT column, via orjson when available"""
+    if HAS_ORJSON:
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj)
+
+
+def _loads(text):
+    """Parse JSON text, via orjson when available"""
+    if HAS_ORJSON:
+        return orjson.loads(text)
+    return json.loads(text)
+
 
 class RelationshipType(str, Enum):
     """Types of relationships between nodes"""
@@ -60,9 +81,9 @@ class Node:
             'label': self.label,
             'description': self.description,
             'category': self.category,
-            'keywords': json.dumps(self.keywords) if self.keywords else None,
+            'keywords': _dumps_text(self.keywords) if self.keywords else None,
             'embedding': self.embedding.tobytes() if self.embedding is not None else None,
-            'metadata': json.dumps(self.metadata) if self.metadata else None,
+            'metadata': _dumps_text(self.metadata) if self.metadata else None,
             'created_at': self.created_at or int(datetime.now().timestamp()),
             'updated_at': self.updated_at or int(datetime.now().timestamp()),
         }
@@ -70,8 +91,8 @@ class Node:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Node':
         """Create Node from dictionary"""
-        keywords = json.loads(data.get('keywords', '[]')) if data.get('keywords') else []
-        metadata = json.loads(data.get('metadata', '{}')) if data.get('metadata') else {}
+        keywords = _loads(data['keywords']) if data.get('keywords') else []
+        metadata = _loads(data['metadata']) if data.get('metadata') else {}
         embedding = None
         if data.get('embedding'):
             embedding = np.frombuffer(data['embedding'], dtype=np.float32).reshape(-1)
@@ -108,14 +129,14 @@ class Edge:
             'target_id': self.target_id,
             'type': self.type.value,
             'strength': self.strength,
-            'metadata': json.dumps(self.metadata) if self.metadata else None,
+            'metadata': _dumps_text(self.metadata) if self.metadata else None,
             'created_at': self.created_at or int(datetime.now().timestamp()),
         }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Edge':
         """Create Edge from dictionary"""
-        metadata = json.loads(data.get('metadata', '{}')) if data.get('metadata') else {}
+        metadata = _loads(data['metadata']) if data.get('metadata') else {}
 
         return cls(
             id=data['id'],
@@ -60,6 +60,16 @@ CREATE TABLE IF NOT EXISTS embeddings (
 CREATE INDEX IF NOT EXISTS idx_embeddings_node_id ON embeddings(node_id);
 CREATE INDEX IF NOT EXISTS idx_embeddings_model ON embeddings(model);
 
+-- Packed Embedding Matrix (all vectors for a model as one float16 blob)
+CREATE TABLE IF NOT EXISTS embedding_matrix (
+    model TEXT PRIMARY KEY,
+    node_ids TEXT NOT NULL,
+    matrix BLOB NOT NULL,
+    dimension INTEGER NOT NULL,
+    rows INTEGER NOT NULL,
+    updated_at INTEGER
+);
+
 -- Graph Metadata (Configuration and statistics)
 CREATE TABLE IF NOT EXISTS graph_metadata (
     key TEXT PRIMARY KEY,